@@ -14,14 +14,26 @@ d = { 'settings': { 'branch': 'main',
                                                                                           'mlforecast/callbacks.py')},
             'mlforecast.compat': {},
             'mlforecast.core': { 'mlforecast.core.TimeSeries': ('core.html#timeseries', 'mlforecast/core.py'),
+                                 'mlforecast.core.TimeSeries.__copy__': ('core.html#timeseries.__copy__', 'mlforecast/core.py'),
+                                 'mlforecast.core.TimeSeries.__getstate__': ('core.html#timeseries.__getstate__', 'mlforecast/core.py'),
                                  'mlforecast.core.TimeSeries.__init__': ('core.html#timeseries.__init__', 'mlforecast/core.py'),
                                  'mlforecast.core.TimeSeries.__repr__': ('core.html#timeseries.__repr__', 'mlforecast/core.py'),
+                                 'mlforecast.core.TimeSeries._advance_lag_tfms_states': ( 'core.html#timeseries._advance_lag_tfms_states',
+                                                                                          'mlforecast/core.py'),
                                  'mlforecast.core.TimeSeries._compute_date_feature': ( 'core.html#timeseries._compute_date_feature',
                                                                                        'mlforecast/core.py'),
+                                 'mlforecast.core.TimeSeries._compute_missing_lag_tfms_states': ( 'core.html#timeseries._compute_missing_lag_tfms_states',
+                                                                                                  'mlforecast/core.py'),
                                  'mlforecast.core.TimeSeries._compute_transforms': ( 'core.html#timeseries._compute_transforms',
                                                                                      'mlforecast/core.py'),
+                                 'mlforecast.core.TimeSeries._continue_lag_tfms_states': ( 'core.html#timeseries._continue_lag_tfms_states',
+                                                                                           'mlforecast/core.py'),
                                  'mlforecast.core.TimeSeries._date_feature_names': ( 'core.html#timeseries._date_feature_names',
                                                                                      'mlforecast/core.py'),
+                                 'mlforecast.core.TimeSeries._date_feature_values': ( 'core.html#timeseries._date_feature_values',
+                                                                                      'mlforecast/core.py'),
+                                 'mlforecast.core.TimeSeries._features_array': ( 'core.html#timeseries._features_array',
+                                                                                 'mlforecast/core.py'),
                                  'mlforecast.core.TimeSeries._fit': ('core.html#timeseries._fit', 'mlforecast/core.py'),
                                  'mlforecast.core.TimeSeries._get_features_for_next_step': ( 'core.html#timeseries._get_features_for_next_step',
                                                                                              'mlforecast/core.py'),
@@ -31,13 +43,28 @@ d = { 'settings': { 'branch': 'main',
                                                                                   'mlforecast/core.py'),
                                  'mlforecast.core.TimeSeries._get_raw_predictions': ( 'core.html#timeseries._get_raw_predictions',
                                                                                       'mlforecast/core.py'),
+                                 'mlforecast.core.TimeSeries._get_uids_index': ( 'core.html#timeseries._get_uids_index',
+                                                                                 'mlforecast/core.py'),
                                  'mlforecast.core.TimeSeries._has_ga_target_tfms': ( 'core.html#timeseries._has_ga_target_tfms',
                                                                                      'mlforecast/core.py'),
+                                 'mlforecast.core.TimeSeries._null_masks': ('core.html#timeseries._null_masks', 'mlforecast/core.py'),
+                                 'mlforecast.core.TimeSeries._predict_columns': ( 'core.html#timeseries._predict_columns',
+                                                                                  'mlforecast/core.py'),
                                  'mlforecast.core.TimeSeries._predict_multi': ('core.html#timeseries._predict_multi', 'mlforecast/core.py'),
                                  'mlforecast.core.TimeSeries._predict_recursive': ( 'core.html#timeseries._predict_recursive',
                                                                                     'mlforecast/core.py'),
                                  'mlforecast.core.TimeSeries._predict_setup': ('core.html#timeseries._predict_setup', 'mlforecast/core.py'),
+                                 'mlforecast.core.TimeSeries._predict_static_columns': ( 'core.html#timeseries._predict_static_columns',
+                                                                                         'mlforecast/core.py'),
+                                 'mlforecast.core.TimeSeries._set_dropped_series': ( 'core.html#timeseries._set_dropped_series',
+                                                                                     'mlforecast/core.py'),
+                                 'mlforecast.core.TimeSeries._stateful_lag_tfms': ( 'core.html#timeseries._stateful_lag_tfms',
+                                                                                    'mlforecast/core.py'),
                                  'mlforecast.core.TimeSeries._transform': ('core.html#timeseries._transform', 'mlforecast/core.py'),
+                                 'mlforecast.core.TimeSeries._transform_iter': ( 'core.html#timeseries._transform_iter',
+                                                                                 'mlforecast/core.py'),
+                                 'mlforecast.core.TimeSeries._uids_positions': ( 'core.html#timeseries._uids_positions',
+                                                                                 'mlforecast/core.py'),
                                  'mlforecast.core.TimeSeries._update_features': ( 'core.html#timeseries._update_features',
                                                                                   'mlforecast/core.py'),
                                  'mlforecast.core.TimeSeries._update_y': ('core.html#timeseries._update_y', 'mlforecast/core.py'),
@@ -47,16 +74,23 @@ d = { 'settings': { 'branch': 'main',
                                  'mlforecast.core.TimeSeries.predict': ('core.html#timeseries.predict', 'mlforecast/core.py'),
                                  'mlforecast.core.TimeSeries.save': ('core.html#timeseries.save', 'mlforecast/core.py'),
                                  'mlforecast.core.TimeSeries.update': ('core.html#timeseries.update', 'mlforecast/core.py'),
+                                 'mlforecast.core._as_lag_transform': ('core.html#_as_lag_transform', 'mlforecast/core.py'),
                                  'mlforecast.core._as_tuple': ('core.html#_as_tuple', 'mlforecast/core.py'),
                                  'mlforecast.core._build_function_transform_name': ( 'core.html#_build_function_transform_name',
                                                                                      'mlforecast/core.py'),
                                  'mlforecast.core._build_lag_transform_name': ('core.html#_build_lag_transform_name', 'mlforecast/core.py'),
                                  'mlforecast.core._build_transform_name': ('core.html#_build_transform_name', 'mlforecast/core.py'),
+                                 'mlforecast.core._collect_sorted': ('core.html#_collect_sorted', 'mlforecast/core.py'),
+                                 'mlforecast.core._concat_series': ('core.html#_concat_series', 'mlforecast/core.py'),
                                  'mlforecast.core._expand_target': ('core.html#_expand_target', 'mlforecast/core.py'),
+                                 'mlforecast.core._factorize_dates': ('core.html#_factorize_dates', 'mlforecast/core.py'),
                                  'mlforecast.core._identity': ('core.html#_identity', 'mlforecast/core.py'),
+                                 'mlforecast.core._ids_positions': ('core.html#_ids_positions', 'mlforecast/core.py'),
+                                 'mlforecast.core._is_arrow_dataset': ('core.html#_is_arrow_dataset', 'mlforecast/core.py'),
                                  'mlforecast.core._name_models': ('core.html#_name_models', 'mlforecast/core.py'),
                                  'mlforecast.core._parse_transforms': ('core.html#_parse_transforms', 'mlforecast/core.py'),
-                                 'mlforecast.core._pascal2camel': ('core.html#_pascal2camel', 'mlforecast/core.py')},
+                                 'mlforecast.core._pascal2camel': ('core.html#_pascal2camel', 'mlforecast/core.py'),
+                                 'mlforecast.core._uids_to_numpy': ('core.html#_uids_to_numpy', 'mlforecast/core.py')},
             'mlforecast.distributed.forecast': { 'mlforecast.distributed.forecast.DistributedMLForecast': ( 'distributed.forecast.html#distributedmlforecast',
                                                                                                             'mlforecast/distributed/forecast.py'),
                                                  'mlforecast.distributed.forecast.DistributedMLForecast.__init__': ( 'distributed.forecast.html#distributedmlforecast.__init__',
@@ -132,12 +166,26 @@ d = { 'settings': { 'branch': 'main',
                                                                                   'mlforecast/forecast.py'),
                                      'mlforecast.forecast.MLForecast._compute_fitted_values': ( 'forecast.html#mlforecast._compute_fitted_values',
                                                                                                 'mlforecast/forecast.py'),
+                                     'mlforecast.forecast.MLForecast._conformity_cv': ( 'forecast.html#mlforecast._conformity_cv',
+                                                                                        'mlforecast/forecast.py'),
                                      'mlforecast.forecast.MLForecast._conformity_scores': ( 'forecast.html#mlforecast._conformity_scores',
                                                                                             'mlforecast/forecast.py'),
+                                     'mlforecast.forecast.MLForecast._cross_validation_windows': ( 'forecast.html#mlforecast._cross_validation_windows',
+                                                                                                   'mlforecast/forecast.py'),
+                                     'mlforecast.forecast.MLForecast._cv_copy': ( 'forecast.html#mlforecast._cv_copy',
+                                                                                  'mlforecast/forecast.py'),
+                                     'mlforecast.forecast.MLForecast._cv_features': ( 'forecast.html#mlforecast._cv_features',
+                                                                                      'mlforecast/forecast.py'),
                                      'mlforecast.forecast.MLForecast._extract_X_y': ( 'forecast.html#mlforecast._extract_x_y',
                                                                                       'mlforecast/forecast.py'),
+                                     'mlforecast.forecast.MLForecast._fit_from_features': ( 'forecast.html#mlforecast._fit_from_features',
+                                                                                            'mlforecast/forecast.py'),
                                      'mlforecast.forecast.MLForecast._invert_transforms_fitted': ( 'forecast.html#mlforecast._invert_transforms_fitted',
                                                                                                    'mlforecast/forecast.py'),
+                                     'mlforecast.forecast.MLForecast._new_ts': ( 'forecast.html#mlforecast._new_ts',
+                                                                                 'mlforecast/forecast.py'),
+                                     'mlforecast.forecast.MLForecast._preprocess': ( 'forecast.html#mlforecast._preprocess',
+                                                                                     'mlforecast/forecast.py'),
                                      'mlforecast.forecast.MLForecast.cross_validation': ( 'forecast.html#mlforecast.cross_validation',
                                                                                           'mlforecast/forecast.py'),
                                      'mlforecast.forecast.MLForecast.cross_validation_fitted_values': ( 'forecast.html#mlforecast.cross_validation_fitted_values',
@@ -159,14 +207,50 @@ d = { 'settings': { 'branch': 'main',
                                                                                  'mlforecast/forecast.py'),
                                      'mlforecast.forecast.MLForecast.preprocess': ( 'forecast.html#mlforecast.preprocess',
                                                                                     'mlforecast/forecast.py'),
+                                     'mlforecast.forecast.MLForecast.preprocess_iter': ( 'forecast.html#mlforecast.preprocess_iter',
+                                                                                         'mlforecast/forecast.py'),
                                      'mlforecast.forecast.MLForecast.save': ('forecast.html#mlforecast.save', 'mlforecast/forecast.py'),
+                                     'mlforecast.forecast.Predictor': ('forecast.html#predictor', 'mlforecast/forecast.py'),
+                                     'mlforecast.forecast.Predictor.__init__': ( 'forecast.html#predictor.__init__',
+                                                                                 'mlforecast/forecast.py'),
+                                     'mlforecast.forecast.Predictor.predict': ('forecast.html#predictor.predict', 'mlforecast/forecast.py'),
                                      'mlforecast.forecast._add_conformal_distribution_intervals': ( 'forecast.html#_add_conformal_distribution_intervals',
                                                                                                     'mlforecast/forecast.py'),
                                      'mlforecast.forecast._add_conformal_error_intervals': ( 'forecast.html#_add_conformal_error_intervals',
                                                                                              'mlforecast/forecast.py'),
+                                     'mlforecast.forecast._batches_to_memmap': ( 'forecast.html#_batches_to_memmap',
+                                                                                 'mlforecast/forecast.py'),
+                                     'mlforecast.forecast._conformal_arrays': ('forecast.html#_conformal_arrays', 'mlforecast/forecast.py'),
                                      'mlforecast.forecast._get_conformal_method': ( 'forecast.html#_get_conformal_method',
-                                                                                    'mlforecast/forecast.py')},
-            'mlforecast.grouped_array': { 'mlforecast.grouped_array.GroupedArray': ( 'grouped_array.html#groupedarray',
+                                                                                    'mlforecast/forecast.py'),
+                                     'mlforecast.forecast._group_cv_windows': ('forecast.html#_group_cv_windows', 'mlforecast/forecast.py'),
+                                     'mlforecast.forecast._interval_columns': ('forecast.html#_interval_columns', 'mlforecast/forecast.py'),
+                                     'mlforecast.forecast._lerp': ('forecast.html#_lerp', 'mlforecast/forecast.py'),
+                                     'mlforecast.forecast._quantile_indexes': ('forecast.html#_quantile_indexes', 'mlforecast/forecast.py'),
+                                     'mlforecast.forecast._shares_memory': ('forecast.html#_shares_memory', 'mlforecast/forecast.py')},
+            'mlforecast.grouped_array': { 'mlforecast.grouped_array.ExpandedTarget': ( 'grouped_array.html#expandedtarget',
+                                                                                       'mlforecast/grouped_array.py'),
+                                          'mlforecast.grouped_array.ExpandedTarget.__array__': ( 'grouped_array.html#expandedtarget.__array__',
+                                                                                                 'mlforecast/grouped_array.py'),
+                                          'mlforecast.grouped_array.ExpandedTarget.__getitem__': ( 'grouped_array.html#expandedtarget.__getitem__',
+                                                                                                   'mlforecast/grouped_array.py'),
+                                          'mlforecast.grouped_array.ExpandedTarget.__init__': ( 'grouped_array.html#expandedtarget.__init__',
+                                                                                                'mlforecast/grouped_array.py'),
+                                          'mlforecast.grouped_array.ExpandedTarget.__len__': ( 'grouped_array.html#expandedtarget.__len__',
+                                                                                               'mlforecast/grouped_array.py'),
+                                          'mlforecast.grouped_array.ExpandedTarget.__repr__': ( 'grouped_array.html#expandedtarget.__repr__',
+                                                                                                'mlforecast/grouped_array.py'),
+                                          'mlforecast.grouped_array.ExpandedTarget.all_nan': ( 'grouped_array.html#expandedtarget.all_nan',
+                                                                                               'mlforecast/grouped_array.py'),
+                                          'mlforecast.grouped_array.ExpandedTarget.dtype': ( 'grouped_array.html#expandedtarget.dtype',
+                                                                                             'mlforecast/grouped_array.py'),
+                                          'mlforecast.grouped_array.ExpandedTarget.from_grouped_array': ( 'grouped_array.html#expandedtarget.from_grouped_array',
+                                                                                                          'mlforecast/grouped_array.py'),
+                                          'mlforecast.grouped_array.ExpandedTarget.ndim': ( 'grouped_array.html#expandedtarget.ndim',
+                                                                                            'mlforecast/grouped_array.py'),
+                                          'mlforecast.grouped_array.ExpandedTarget.shape': ( 'grouped_array.html#expandedtarget.shape',
+                                                                                             'mlforecast/grouped_array.py'),
+                                          'mlforecast.grouped_array.GroupedArray': ( 'grouped_array.html#groupedarray',
                                                                                      'mlforecast/grouped_array.py'),
                                           'mlforecast.grouped_array.GroupedArray.__copy__': ( 'grouped_array.html#groupedarray.__copy__',
                                                                                               'mlforecast/grouped_array.py'),
@@ -180,6 +264,10 @@ d = { 'settings': { 'branch': 'main',
                                                                                               'mlforecast/grouped_array.py'),
                                           'mlforecast.grouped_array.GroupedArray.__setitem__': ( 'grouped_array.html#groupedarray.__setitem__',
                                                                                                  'mlforecast/grouped_array.py'),
+                                          'mlforecast.grouped_array.GroupedArray._group_starts': ( 'grouped_array.html#groupedarray._group_starts',
+                                                                                                   'mlforecast/grouped_array.py'),
+                                          'mlforecast.grouped_array.GroupedArray._shards': ( 'grouped_array.html#groupedarray._shards',
+                                                                                             'mlforecast/grouped_array.py'),
                                           'mlforecast.grouped_array.GroupedArray.append': ( 'grouped_array.html#groupedarray.append',
                                                                                             'mlforecast/grouped_array.py'),
                                           'mlforecast.grouped_array.GroupedArray.append_several': ( 'grouped_array.html#groupedarray.append_several',
@@ -190,6 +278,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                       'mlforecast/grouped_array.py'),
                                           'mlforecast.grouped_array.GroupedArray.expand_target': ( 'grouped_array.html#groupedarray.expand_target',
                                                                                                    'mlforecast/grouped_array.py'),
+                                          'mlforecast.grouped_array.GroupedArray.reserve': ( 'grouped_array.html#groupedarray.reserve',
+                                                                                             'mlforecast/grouped_array.py'),
                                           'mlforecast.grouped_array.GroupedArray.restore_difference': ( 'grouped_array.html#groupedarray.restore_difference',
                                                                                                         'mlforecast/grouped_array.py'),
                                           'mlforecast.grouped_array.GroupedArray.restore_fitted_difference': ( 'grouped_array.html#groupedarray.restore_fitted_difference',
@@ -202,6 +292,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                        'mlforecast/grouped_array.py'),
                                           'mlforecast.grouped_array._append_one': ( 'grouped_array.html#_append_one',
                                                                                     'mlforecast/grouped_array.py'),
+                                          'mlforecast.grouped_array._append_one_inplace': ( 'grouped_array.html#_append_one_inplace',
+                                                                                            'mlforecast/grouped_array.py'),
                                           'mlforecast.grouped_array._append_several': ( 'grouped_array.html#_append_several',
                                                                                         'mlforecast/grouped_array.py'),
                                           'mlforecast.grouped_array._apply_difference': ( 'grouped_array.html#_apply_difference',
@@ -209,16 +301,29 @@ d = { 'settings': { 'branch': 'main',
                                           'mlforecast.grouped_array._diff': ('grouped_array.html#_diff', 'mlforecast/grouped_array.py'),
                                           'mlforecast.grouped_array._expand_target': ( 'grouped_array.html#_expand_target',
                                                                                        'mlforecast/grouped_array.py'),
+                                          'mlforecast.grouped_array._reserve': ( 'grouped_array.html#_reserve',
+                                                                                 'mlforecast/grouped_array.py'),
                                           'mlforecast.grouped_array._restore_difference': ( 'grouped_array.html#_restore_difference',
                                                                                             'mlforecast/grouped_array.py'),
                                           'mlforecast.grouped_array._restore_fitted_difference': ( 'grouped_array.html#_restore_fitted_difference',
                                                                                                    'mlforecast/grouped_array.py'),
+                                          'mlforecast.grouped_array._take': ('grouped_array.html#_take', 'mlforecast/grouped_array.py'),
+                                          'mlforecast.grouped_array._target_all_nan': ( 'grouped_array.html#_target_all_nan',
+                                                                                        'mlforecast/grouped_array.py'),
+                                          'mlforecast.grouped_array._target_horizon': ( 'grouped_array.html#_target_horizon',
+                                                                                        'mlforecast/grouped_array.py'),
                                           'mlforecast.grouped_array._transform_series': ( 'grouped_array.html#_transform_series',
                                                                                           'mlforecast/grouped_array.py'),
                                           'mlforecast.grouped_array._update_difference': ( 'grouped_array.html#_update_difference',
                                                                                            'mlforecast/grouped_array.py')},
             'mlforecast.lag_transforms': { 'mlforecast.lag_transforms.BaseLagTransform': ( 'lag_transforms.html#baselagtransform',
                                                                                            'mlforecast/lag_transforms.py'),
+                                           'mlforecast.lag_transforms.BaseLagTransform.put': ( 'lag_transforms.html#baselagtransform.put',
+                                                                                               'mlforecast/lag_transforms.py'),
+                                           'mlforecast.lag_transforms.BaseLagTransform.stack': ( 'lag_transforms.html#baselagtransform.stack',
+                                                                                                 'mlforecast/lag_transforms.py'),
+                                           'mlforecast.lag_transforms.BaseLagTransform.take': ( 'lag_transforms.html#baselagtransform.take',
+                                                                                                'mlforecast/lag_transforms.py'),
                                            'mlforecast.lag_transforms.BaseLagTransform.transform': ( 'lag_transforms.html#baselagtransform.transform',
                                                                                                      'mlforecast/lag_transforms.py'),
                                            'mlforecast.lag_transforms.BaseLagTransform.update': ( 'lag_transforms.html#baselagtransform.update',
@@ -323,6 +428,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                                   'mlforecast/target_transforms.py'),
                                               'mlforecast.target_transforms.BaseGroupedArrayTargetTransform.inverse_transform_fitted': ( 'target_transforms.html#basegroupedarraytargettransform.inverse_transform_fitted',
                                                                                                                                          'mlforecast/target_transforms.py'),
+                                              'mlforecast.target_transforms.BaseGroupedArrayTargetTransform.take': ( 'target_transforms.html#basegroupedarraytargettransform.take',
+                                                                                                                     'mlforecast/target_transforms.py'),
                                               'mlforecast.target_transforms.BaseGroupedArrayTargetTransform.update': ( 'target_transforms.html#basegroupedarraytargettransform.update',
                                                                                                                        'mlforecast/target_transforms.py'),
                                               'mlforecast.target_transforms.BaseLocalScaler': ( 'target_transforms.html#baselocalscaler',
@@ -335,6 +442,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                   'mlforecast/target_transforms.py'),
                                               'mlforecast.target_transforms.BaseLocalScaler.inverse_transform_fitted': ( 'target_transforms.html#baselocalscaler.inverse_transform_fitted',
                                                                                                                          'mlforecast/target_transforms.py'),
+                                              'mlforecast.target_transforms.BaseLocalScaler.take': ( 'target_transforms.html#baselocalscaler.take',
+                                                                                                     'mlforecast/target_transforms.py'),
                                               'mlforecast.target_transforms.BaseLocalScaler.update': ( 'target_transforms.html#baselocalscaler.update',
                                                                                                        'mlforecast/target_transforms.py'),
                                               'mlforecast.target_transforms.BaseTargetTransform': ( 'target_transforms.html#basetargettransform',
@@ -357,6 +466,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                               'mlforecast/target_transforms.py'),
                                               'mlforecast.target_transforms.Differences.inverse_transform_fitted': ( 'target_transforms.html#differences.inverse_transform_fitted',
                                                                                                                      'mlforecast/target_transforms.py'),
+                                              'mlforecast.target_transforms.Differences.take': ( 'target_transforms.html#differences.take',
+                                                                                                 'mlforecast/target_transforms.py'),
                                               'mlforecast.target_transforms.Differences.update': ( 'target_transforms.html#differences.update',
                                                                                                    'mlforecast/target_transforms.py'),
                                               'mlforecast.target_transforms.GlobalSklearnTransformer': ( 'target_transforms.html#globalsklearntransformer',
@@ -377,6 +488,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                           'mlforecast/target_transforms.py'),
                                               'mlforecast.target_transforms.LocalBoxCox.inverse_transform': ( 'target_transforms.html#localboxcox.inverse_transform',
                                                                                                               'mlforecast/target_transforms.py'),
+                                              'mlforecast.target_transforms.LocalBoxCox.take': ( 'target_transforms.html#localboxcox.take',
+                                                                                                 'mlforecast/target_transforms.py'),
                                               'mlforecast.target_transforms.LocalMinMaxScaler': ( 'target_transforms.html#localminmaxscaler',
                                                                                                   'mlforecast/target_transforms.py'),
                                               'mlforecast.target_transforms.LocalRobustScaler': ( 'target_transforms.html#localrobustscaler',
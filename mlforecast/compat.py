@@ -9,7 +9,7 @@ try:
     import coreforecast.scalers as core_scalers
     from coreforecast.grouped_array import GroupedArray as CoreGroupedArray
 
-    from mlforecast.lag_transforms import BaseLagTransform, Lag
+    from mlforecast.lag_transforms import BaseLagTransform, Lag, _window_ops_equivalents
 
     CORE_INSTALLED = True
 except ImportError:
@@ -21,5 +21,12 @@ except ImportError:
         ...
 
     Lag = None
+    _window_ops_equivalents = {}
 
     CORE_INSTALLED = False
+try:
+    from polars import LazyFrame as pl_LazyFrame
+except ImportError:
+
+    class pl_LazyFrame:
+        ...
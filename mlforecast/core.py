@@ -4,23 +4,39 @@
 __all__ = ['TimeSeries']
 
 # %% ../nbs/core.ipynb 3
+import concurrent.futures
 import copy
 import inspect
+import json
 import re
 import reprlib
+import sys
 import warnings
 from collections import Counter, OrderedDict
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 
 import cloudpickle
 import fsspec
 import numpy as np
 import pandas as pd
 import utilsforecast.processing as ufp
+from fsspec.implementations.local import LocalFileSystem
 from numba import njit
 from sklearn.base import BaseEstimator, clone
 from utilsforecast.compat import (
+    POLARS_INSTALLED,
     DataFrame,
     pl,
     pl_DataFrame,
@@ -28,8 +44,15 @@ from utilsforecast.compat import (
 )
 from utilsforecast.validation import validate_format, validate_freq
 
-from .compat import CORE_INSTALLED, BaseLagTransform, Lag
-from .grouped_array import GroupedArray
+from mlforecast.compat import (
+    CORE_INSTALLED,
+    BaseLagTransform,
+    CoreGroupedArray,
+    Lag,
+    _window_ops_equivalents,
+    pl_LazyFrame,
+)
+from .grouped_array import ExpandedTarget, GroupedArray
 from mlforecast.target_transforms import (
     BaseGroupedArrayTargetTransform,
     BaseTargetTransform,
@@ -61,7 +84,54 @@ date_features_dtypes = {
     "is_year_end": np.uint8,
 }
 
+
+def _factorize_dates(dates) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Integer representation of the unique timestamps in `dates` (sorted),
+    position of each row in them and the first row where each one appears."""
+    if isinstance(dates, pl_Series):
+        keys = dates.to_physical().to_numpy()
+    elif isinstance(dates, pd.DatetimeIndex):
+        keys = dates.asi8
+    else:
+        keys = np.asarray(dates)
+    codes, uniques = pd.factorize(keys)
+    first = np.empty(uniques.size, dtype=np.intp)
+    first[codes[::-1]] = np.arange(codes.size - 1, -1, -1)
+    order = np.argsort(uniques)
+    ranks = np.empty_like(order)
+    ranks[order] = np.arange(order.size)
+    return uniques[order], ranks[codes], first[order]
+
 # %% ../nbs/core.ipynb 11
+def _is_arrow_dataset(df) -> bool:
+    # pyarrow.dataset is slow to import, it's only loaded if the caller already created a dataset
+    pa_ds = sys.modules.get("pyarrow.dataset")
+    return pa_ds is not None and isinstance(df, pa_ds.Dataset)
+
+
+def _collect_sorted(
+    df: Union[DataFrame, pl_LazyFrame, str, Path], id_col: str, time_col: str
+) -> DataFrame:
+    """Collect lazy inputs with polars sorted by id and time, so that the sort is part of the query.
+
+    These can be a polars LazyFrame, a pyarrow Dataset or a path to parquet files (optionally partitioned),
+    which are scanned by batches. Projections and filters in the query are pushed down to the scan.
+    Other frames are returned as is."""
+    if isinstance(df, (str, Path)) or _is_arrow_dataset(df):
+        if not POLARS_INSTALLED:
+            raise ImportError(
+                "polars is required to read parquet files and pyarrow datasets."
+            )
+        if isinstance(df, (str, Path)):
+            import pyarrow.dataset as pa_ds
+
+            df = pa_ds.dataset(df, format="parquet", partitioning="hive")
+        df = pl.scan_pyarrow_dataset(df)
+    if isinstance(df, pl_LazyFrame):
+        df = df.sort([id_col, time_col]).collect()
+    return df
+
+# %% ../nbs/core.ipynb 12
 def _build_function_transform_name(tfm: Callable, lag: int, *args) -> str:
     """Creates a name for a transformation based on `lag`, the name of the function and its arguments."""
     tfm_name = f"{tfm.__name__}_lag{lag}"
@@ -76,11 +146,11 @@ def _build_function_transform_name(tfm: Callable, lag: int, *args) -> str:
         tfm_name += "_" + "_".join(changed_params)
     return tfm_name
 
-# %% ../nbs/core.ipynb 13
+# %% ../nbs/core.ipynb 14
 def _pascal2camel(pascal_str: str) -> str:
     return re.sub(r"(?<!^)(?=[A-Z])", "_", pascal_str).lower()
 
-# %% ../nbs/core.ipynb 14
+# %% ../nbs/core.ipynb 15
 def _build_lag_transform_name(tfm: BaseLagTransform, lag: int) -> str:
     tfm_params = list(inspect.signature(tfm.__init__).parameters.items())  # type: ignore
     tfm_name = f"{_pascal2camel(tfm.__class__.__name__)}_lag{lag}"
@@ -93,7 +163,7 @@ def _build_lag_transform_name(tfm: BaseLagTransform, lag: int) -> str:
         tfm_name += "_" + "_".join(changed_params)
     return tfm_name
 
-# %% ../nbs/core.ipynb 16
+# %% ../nbs/core.ipynb 17
 def _build_transform_name(
     tfm: Union[Callable, BaseLagTransform], lag: int, *args
 ) -> str:
@@ -103,7 +173,7 @@ def _build_transform_name(
         name = _build_lag_transform_name(tfm, lag)
     return name
 
-# %% ../nbs/core.ipynb 17
+# %% ../nbs/core.ipynb 18
 def _name_models(current_names):
     ctr = Counter(current_names)
     if not ctr:
@@ -121,7 +191,7 @@ def _name_models(current_names):
         names[-i] = name
     return names
 
-# %% ../nbs/core.ipynb 19
+# %% ../nbs/core.ipynb 20
 @njit
 def _identity(x: np.ndarray) -> np.ndarray:
     """Do nothing to the input."""
@@ -151,7 +221,7 @@ def _expand_target(data, indptr, max_horizon):
             n += 1
     return out
 
-# %% ../nbs/core.ipynb 20
+# %% ../nbs/core.ipynb 21
 Freq = Union[int, str, pd.offsets.BaseOffset]
 Lags = Iterable[int]
 LagTransform = Union[Callable, Tuple[Callable, Any]]
@@ -161,7 +231,77 @@ Models = Union[BaseEstimator, List[BaseEstimator], Dict[str, BaseEstimator]]
 TargetTransform = Union[BaseTargetTransform, BaseGroupedArrayTargetTransform]
 Transforms = Dict[str, Union[Tuple[Any, ...], BaseLagTransform]]
 
-# %% ../nbs/core.ipynb 21
+# %% ../nbs/core.ipynb 22
+# version of the directory layout written by `TimeSeries.save(binary=True)`
+_BINARY_FORMAT_VERSION = 1
+
+
+def _uids_to_numpy(uids: Union[pd.Index, pl_Series]) -> np.ndarray:
+    """Ids as an array of numbers or fixed-width strings, which can be memory-mapped."""
+    if isinstance(uids, pl_Series):
+        vals = (
+            uids.to_numpy()
+            if uids.dtype.is_numeric()
+            else uids.cast(pl.Utf8).to_numpy()
+        )
+    else:
+        vals = np.asarray(uids)
+    if vals.dtype.kind not in "biuf":
+        vals = vals.astype(str)
+    return vals
+
+
+def _ids_positions(
+    uids: Union[np.ndarray, pd.Index], ids: List, is_sorted: bool
+) -> np.ndarray:
+    """Sorted positions of `ids` in `uids`. Raises an error if any of them is missing."""
+    ids_arr = np.asarray(ids)
+    if uids.dtype.kind == "U":
+        ids_arr = ids_arr.astype(str)
+    if is_sorted:
+        pos = np.minimum(np.searchsorted(uids, ids_arr), uids.size - 1)
+        found = uids[pos] == ids_arr
+    else:
+        # pandas builds the hash table of an index once and keeps it
+        index = uids if isinstance(uids, pd.Index) else pd.Index(uids)
+        pos = index.get_indexer(ids_arr)
+        found = pos >= 0
+    if not found.all():
+        unseen = set(ids_arr[~found].tolist())
+        raise ValueError(
+            f"The following ids weren't seen during training and thus can't be forecasted: {unseen}"
+        )
+    return np.unique(pos)
+
+
+def _concat_series(
+    values: List[Union[pd.Index, DataFrame, pl_Series]]
+) -> Union[pd.Index, DataFrame, pl_Series]:
+    """Concatenate the blocks of series written by `TimeSeries.save(binary=True)`."""
+    # the blocks are slices of the same object, so the categories are the same in all of them
+    if len(values) == 1:
+        return values[0]
+    if isinstance(values[0], pl_Series):
+        return pl.concat(cast(List[pl_Series], values))
+    if isinstance(values[0], pl_DataFrame):
+        return pl.concat(cast(List[pl_DataFrame], values))
+    if isinstance(values[0], pd.DataFrame):
+        return pd.concat(values, ignore_index=True)
+    return values[0].append(values[1:])
+
+# %% ../nbs/core.ipynb 23
+def _as_lag_transform(tfm: Callable, *args) -> Optional[BaseLagTransform]:
+    """Builds the equivalent of the window_ops function `tfm` from `mlforecast.lag_transforms`, if there is one."""
+    equivalent = next(
+        (cls for func, cls in _window_ops_equivalents.items() if func is tfm), None
+    )
+    if equivalent is None:
+        return None
+    params = inspect.signature(tfm).bind(None, *args).arguments
+    params.pop(next(iter(params)))  # remove input array argument
+    return equivalent(**params)
+
+
 def _parse_transforms(
     lags: Lags,
     lag_transforms: LagTransforms,
@@ -184,13 +324,28 @@ def _parse_transforms(
                 tfm, *args = _as_tuple(tfm)
                 assert callable(tfm)
                 tfm_name = namer(tfm, lag, *args)
-                transforms[tfm_name] = (lag, tfm, *args)
+                lag_tfm = _as_lag_transform(tfm, *args)
+                if lag_tfm is not None:
+                    transforms[tfm_name] = lag_tfm._set_core_tfm(lag)
+                else:
+                    transforms[tfm_name] = (lag, tfm, *args)
     return transforms
 
-# %% ../nbs/core.ipynb 22
+# %% ../nbs/core.ipynb 24
 class TimeSeries:
     """Utility class for storing and transforming time series data."""
 
+    # maximum number of timestamps for which each date feature is cached
+    _date_features_cache_size: int = 1_000_000
+    # number of series in each file of the ids, last dates and static features written by `save(binary=True)`
+    _series_block_size: int = 100_000
+    # attributes that are computed when they're needed, which aren't pickled
+    _caches: Tuple[str, ...] = (
+        "_uids_index",
+        "_static_columns_cache",
+        "_date_features_cache",
+    )
+
     def __init__(
         self,
         freq: Freq,
@@ -200,6 +355,7 @@ class TimeSeries:
         num_threads: int = 1,
         target_transforms: Optional[List[TargetTransform]] = None,
         lag_transforms_namer: Optional[Callable] = None,
+        dtype: Optional[Union[str, np.dtype]] = None,
     ):
         self.freq = freq
         if not isinstance(num_threads, int) or num_threads < 1:
@@ -222,6 +378,11 @@ class TimeSeries:
                     "Can't use a lambda as a date feature because the function name gets used as the feature name."
                 )
         self.lag_transforms_namer = lag_transforms_namer
+        if dtype is not None:
+            dtype = np.dtype(dtype)
+            if not np.issubdtype(dtype, np.floating):
+                raise ValueError(f"dtype must be a floating point type, got {dtype}.")
+        self.dtype = dtype
         self.transforms = _parse_transforms(
             lags=self.lags,
             lag_transforms=self.lag_transforms,
@@ -275,6 +436,8 @@ class TimeSeries:
         )
         if data.ndim == 2:
             data = data[:, 0]
+        if self.dtype is not None:
+            data = data.astype(self.dtype, copy=False)
         ga = GroupedArray(data, indptr)
         if isinstance(df, pd.DataFrame):
             self.uids = pd.Index(uids)
@@ -306,7 +469,12 @@ class TimeSeries:
                     tfm.set_column_names(id_col, time_col, target_col)
                     sorted_df = tfm.fit_transform(sorted_df)
                     ga.data = sorted_df[target_col].to_numpy()
+        if self.dtype is not None:
+            ga.data = ga.data.astype(self.dtype, copy=False)
         self.ga = ga
+        # the stateful lag transforms get the state of each serie when computing the features,
+        # the ones whose features aren't computed get it before predicting
+        self._lag_tfms_without_state = self._stateful_lag_tfms()
         last_idxs_per_serie = self.ga.indptr[1:] - 1
         to_drop = [id_col, time_col, target_col]
         if static_features is None:
@@ -330,7 +498,7 @@ class TimeSeries:
         """Compute the transformations defined in the constructor.
 
         If `self.num_threads > 1` these are computed using multithreading."""
-        if self.num_threads == 1 or len(transforms) == 1:
+        if self.num_threads == 1:
             out = self.ga.apply_transforms(
                 transforms=transforms, updates_only=updates_only
             )
@@ -342,24 +510,140 @@ class TimeSeries:
             )
         return out
 
-    def _compute_date_feature(self, dates, feature):
+    def _compute_date_feature(self, dates, feature, factorized=None):
+        """Computes `feature` once for each unique timestamp in `dates`.
+
+        The values are cached by timestamp, so the ones that were already computed are looked up.
+        `factorized` is the output of `_factorize_dates(dates)`, to share it across features.
+        """
+        feat_name = feature.__name__ if callable(feature) else feature
+        if factorized is None:
+            factorized = _factorize_dates(dates)
+        keys, codes, first = factorized
+        if not hasattr(self, "_date_features_cache"):
+            self._date_features_cache: Dict[
+                Tuple[str, str], Tuple[np.ndarray, np.ndarray]
+            ] = {}
+        cache_key = (feat_name, str(dates.dtype))
+        cached = self._date_features_cache.get(cache_key)
+        if cached is None or cached[0].size == 0:
+            vals = self._date_feature_values(ufp.take_rows(dates, first), feature)
+            cached = keys, vals
+        else:
+            cached_keys, cached_vals = cached
+            pos = np.minimum(np.searchsorted(cached_keys, keys), cached_keys.size - 1)
+            missing = cached_keys[pos] != keys
+            if missing.any():
+                new_vals = self._date_feature_values(
+                    ufp.take_rows(dates, first[missing]), feature
+                )
+                vals = np.empty(keys.size, dtype=np.result_type(cached_vals, new_vals))
+                vals[~missing] = cached_vals[pos[~missing]]
+                vals[missing] = new_vals
+                all_keys = np.append(cached_keys, keys[missing])
+                if all_keys.size <= self._date_features_cache_size:
+                    order = np.argsort(all_keys)
+                    cached = all_keys[order], np.append(cached_vals, new_vals)[order]
+                else:
+                    cached = keys, vals
+            else:
+                vals = cached_vals[pos]
+        self._date_features_cache[cache_key] = cached
+        return feat_name, vals[codes]
+
+    def _date_feature_values(self, dates, feature) -> np.ndarray:
         if callable(feature):
-            feat_name = feature.__name__
             feat_vals = feature(dates)
         else:
-            feat_name = feature
             if isinstance(dates, pd.DatetimeIndex):
                 if feature in ("week", "weekofyear"):
                     dates = dates.isocalendar()
                 feat_vals = getattr(dates, feature)
             else:
                 feat_vals = getattr(dates.dt, feature)()
-        if not isinstance(feat_vals, pl_Series):
-            feat_vals = np.asarray(feat_vals)
-            feat_dtype = date_features_dtypes.get(feature)
-            if feat_dtype is not None:
-                feat_vals = feat_vals.astype(feat_dtype)
-        return feat_name, feat_vals
+        if isinstance(feat_vals, pl_Series):
+            return feat_vals.to_numpy()
+        feat_vals = np.asarray(feat_vals)
+        feat_dtype = date_features_dtypes.get(feature)
+        if feat_dtype is not None:
+            feat_vals = feat_vals.astype(feat_dtype)
+        return feat_vals
+
+    def _set_dropped_series(self, keep_rows: np.ndarray) -> None:
+        """Save and warn about the series whose rows were all dropped, i.e. the ones whose last row isn't in `keep_rows`."""
+        last_idxs = self.ga.indptr[1:] - 1
+        if self._sort_idxs is not None:
+            last_idxs = self._sort_idxs[last_idxs]
+        last_vals_nan = ~keep_rows[last_idxs]
+        if last_vals_nan.any():
+            self._dropped_series: Optional[np.ndarray] = np.where(last_vals_nan)[0]
+            dropped_ids = reprlib.repr(list(self.uids[self._dropped_series]))
+            warnings.warn(
+                "The following series were dropped completely "
+                f"due to the transformations and features: {dropped_ids}.\n"
+                "These series won't show up if you use `MLForecast.forecast_fitted_values()`.\n"
+                "You can set `dropna=False` or use transformations that require less samples to mitigate this"
+            )
+        else:
+            self._dropped_series = None
+
+    def _features_array(
+        self,
+        df: DataFrame,
+        features: Dict[str, np.ndarray],
+        keep_rows: Optional[np.ndarray],
+    ) -> Optional[np.ndarray]:
+        """Write the features in `features_order_` directly into a single array, keeping only the rows in `keep_rows`.
+
+        Returns None if any of the columns from `df` isn't numeric."""
+        if keep_rows is None:
+            n_rows = df.shape[0]
+        else:
+            n_rows = int(keep_rows.sum())
+        columns: Dict[str, np.ndarray] = {}
+        date_features = []
+        for name in self.features_order_:
+            if name in features:
+                columns[name] = features[name]
+            elif name in df:
+                # categoricals are converted to their codes
+                vals = ufp.to_numpy(df[[name]])[:, 0]
+                if vals.dtype.kind not in "biuf":
+                    return None
+                columns[name] = vals
+            else:
+                date_features.append(name)
+        dtypes = [vals.dtype for vals in columns.values()]
+        if date_features:
+            dates = df[[self.time_col]]
+            if keep_rows is not None:
+                dates = ufp.filter_with_mask(dates, keep_rows)
+            dates = dates[self.time_col]
+            if isinstance(dates, pd.Series) and not np.issubdtype(
+                dates.dtype.type, np.integer
+            ):
+                dates = pd.DatetimeIndex(dates)
+            date_feature_vals = {}
+            factorized = _factorize_dates(dates)
+            for feature in self.date_features:
+                feat_name = feature.__name__ if callable(feature) else feature
+                if feat_name not in date_features:
+                    continue
+                _, feat_vals = self._compute_date_feature(dates, feature, factorized)
+                date_feature_vals[feat_name] = np.asarray(feat_vals)
+                dtypes.append(date_feature_vals[feat_name].dtype)
+        # fortran order so that each column is written contiguously
+        dtype = self.dtype if self.dtype is not None else np.result_type(*dtypes)
+        X = np.empty((n_rows, len(self.features_order_)), dtype=dtype, order="F")
+        for i, name in enumerate(self.features_order_):
+            if name in columns:
+                vals = columns[name]
+                if keep_rows is not None:
+                    vals = vals[keep_rows]
+            else:
+                vals = date_feature_vals[name]
+            X[:, i] = vals
+        return X
 
     def _transform(
         self,
@@ -374,52 +658,40 @@ class TimeSeries:
         if `dropna=True` then all the null rows are dropped."""
         transforms = {k: v for k, v in self.transforms.items() if k not in df}
         features = self._compute_transforms(transforms=transforms, updates_only=False)
+        self._lag_tfms_without_state = [
+            name for name in self._lag_tfms_without_state if name not in transforms
+        ]
         if self._restore_idxs is not None:
             for k, v in features.items():
                 features[k] = v[self._restore_idxs]
 
         # target
         self.max_horizon = max_horizon
+        # the target for each horizon is computed when it's needed
+        target: Union[np.ndarray, ExpandedTarget]
         if max_horizon is None:
             target = self.ga.data
         else:
-            target = self.ga.expand_target(max_horizon)
+            target = ExpandedTarget.from_grouped_array(self.ga, max_horizon)
         if self._restore_idxs is not None:
             target = target[self._restore_idxs]
 
         # determine rows to keep
+        keep_rows: Optional[np.ndarray] = None
         if dropna:
             feature_nulls = np.full(df.shape[0], False)
             for feature_vals in features.values():
                 feature_nulls |= np.isnan(feature_vals)
-            target_nulls = np.isnan(target)
-            if target_nulls.ndim == 2:
+            if isinstance(target, ExpandedTarget):
                 # target nulls for each horizon are dropped in MLForecast.fit_models
                 # we just drop rows here for which all the target values are null
-                target_nulls = target_nulls.all(axis=1)
+                target_nulls = target.all_nan()
+            else:
+                target_nulls = np.isnan(target)
             keep_rows = ~(feature_nulls | target_nulls)
-            for k, v in features.items():
-                features[k] = v[keep_rows]
             target = target[keep_rows]
-            df = ufp.filter_with_mask(df, keep_rows)
-            df = ufp.copy_if_pandas(df, deep=False)
-            last_idxs = self.ga.indptr[1:] - 1
-            if self._sort_idxs is not None:
-                last_idxs = self._sort_idxs[last_idxs]
-            last_vals_nan = ~keep_rows[last_idxs]
-            if last_vals_nan.any():
-                self._dropped_series: Optional[np.ndarray] = np.where(last_vals_nan)[0]
-                dropped_ids = reprlib.repr(list(self.uids[self._dropped_series]))
-                warnings.warn(
-                    "The following series were dropped completely "
-                    f"due to the transformations and features: {dropped_ids}.\n"
-                    "These series won't show up if you use `MLForecast.forecast_fitted_values()`.\n"
-                    "You can set `dropna=False` or use transformations that require less samples to mitigate this"
-                )
-            else:
-                self._dropped_series = None
-        elif isinstance(df, pd.DataFrame):
-            df = df.copy(deep=False)
+            self._set_dropped_series(keep_rows)
+        else:
             self._dropped_series = None
 
         # once we've computed the features and target we can slice the series
@@ -427,9 +699,20 @@ class TimeSeries:
             self.ga = self.ga.take_from_groups(slice(-self.keep_last_n, None))
         del self._restore_idxs, self._sort_idxs
 
+        if return_X_y and as_numpy:
+            features_arr = self._features_array(df, features, keep_rows)
+            if features_arr is not None:
+                return features_arr, target
+        if keep_rows is not None:
+            for k, v in features.items():
+                features[k] = v[keep_rows]
+            df = ufp.filter_with_mask(df, keep_rows)
+            df = ufp.copy_if_pandas(df, deep=False)
+        elif isinstance(df, pd.DataFrame):
+            df = df.copy(deep=False)
+
         # lag transforms
-        for feat in transforms.keys():
-            df = ufp.assign_columns(df, feat, features[feat])
+        new_features = {feat: features[feat] for feat in transforms.keys()}
 
         # date features
         if self.date_features:
@@ -438,12 +721,22 @@ class TimeSeries:
                 dates.dtype.type, np.integer
             ):
                 dates = pd.DatetimeIndex(dates)
+            factorized = _factorize_dates(dates)
             for feature in self.date_features:
                 feat_name = feature.__name__ if callable(feature) else feature
                 if feat_name in df:
                     continue
-                _, feat_vals = self._compute_date_feature(dates, feature)
-                df = ufp.assign_columns(df, feat_name, feat_vals)
+                _, new_features[feat_name] = self._compute_date_feature(
+                    dates, feature, factorized
+                )
+        if isinstance(df, pl_DataFrame):
+            # add all the features in a single batch
+            df = df.with_columns(
+                [pl_Series(name, vals) for name, vals in new_features.items()]
+            )
+        else:
+            for name, vals in new_features.items():
+                df = ufp.assign_columns(df, name, vals)
 
         # assemble return
         if return_X_y:
@@ -456,7 +749,7 @@ class TimeSeries:
             out_cols = [c for c in df.columns if c != self.target_col]
             df = df[out_cols]
             target_names = [f"{self.target_col}{i}" for i in range(max_horizon)]
-            df = ufp.assign_columns(df, target_names, target)
+            df = ufp.assign_columns(df, target_names, np.asarray(target))
         else:
             if isinstance(df, pd.DataFrame):
                 df = _ensure_shallow_copy(df)
@@ -481,7 +774,9 @@ class TimeSeries:
         If not all features are static, specify which ones are in `static_features`.
         If you don't want to drop rows with null values after the transformations set `dropna=False`
         If `keep_last_n` is not None then that number of observations is kept across all series for updates.
+        If `data` is a polars LazyFrame, a pyarrow Dataset or a path to parquet files it's collected sorted by id and time.
         """
+        data = _collect_sorted(data, id_col, time_col)
         self.dropna = dropna
         self.as_numpy = as_numpy
         self._fit(
@@ -500,6 +795,81 @@ class TimeSeries:
             as_numpy=as_numpy,
         )
 
+    def _transform_iter(
+        self,
+        df: DataFrame,
+        batch_series: int,
+        dropna: bool = True,
+        max_horizon: Optional[int] = None,
+        as_numpy: bool = False,
+    ) -> Iterator[Tuple[Union[DataFrame, np.ndarray], np.ndarray]]:
+        """Compute the features and target for `batch_series` series at a time.
+
+        The rows of each batch are sorted by id and time."""
+        if batch_series < 1:
+            raise ValueError("batch_series must be a positive integer.")
+        ga = self.ga
+        uids = self.uids
+        sort_idxs = self._sort_idxs
+        keep_last_n = self.keep_last_n
+        # each batch is transformed as if it were the full data, so we keep
+        # the complete series here and restore them after the last batch
+        self.keep_last_n = None
+        dropped_series = []
+        # states of the lag transforms for each batch
+        states: Dict[str, List[BaseLagTransform]] = {}
+        transformed_all = False
+        try:
+            for start in range(0, len(ga), batch_series):
+                end = min(start + batch_series, len(ga))
+                first_row, last_row = ga.indptr[start], ga.indptr[end]
+                if sort_idxs is None:
+                    rows = np.arange(first_row, last_row)
+                else:
+                    rows = sort_idxs[first_row:last_row]
+                self.ga = GroupedArray(
+                    ga.data[first_row:last_row], ga.indptr[start : end + 1] - first_row
+                )
+                self.uids = uids[start:end]
+                self._sort_idxs = None
+                self._restore_idxs = None
+                X, y = self._transform(
+                    ufp.take_rows(df, rows),
+                    dropna=dropna,
+                    max_horizon=max_horizon,
+                    return_X_y=True,
+                    as_numpy=as_numpy,
+                )
+                if self._dropped_series is not None:
+                    dropped_series.append(self._dropped_series + start)
+                for name, tfm in self.transforms.items():
+                    if (
+                        isinstance(tfm, BaseLagTransform)
+                        and name not in self._lag_tfms_without_state
+                    ):
+                        states.setdefault(name, []).append(tfm.take(None))
+                yield X, y
+            transformed_all = True
+        finally:
+            self.ga = ga
+            self.uids = uids
+            self.keep_last_n = keep_last_n
+            if keep_last_n is not None:
+                self.ga = self.ga.take_from_groups(slice(-keep_last_n, None))
+            if dropped_series:
+                self._dropped_series = np.hstack(dropped_series)
+            else:
+                self._dropped_series = None
+            if transformed_all:
+                for name, batch_tfms in states.items():
+                    self.transforms[name] = BaseLagTransform.stack(batch_tfms)
+            else:
+                # the states are incomplete, they'll be computed before predicting
+                self._lag_tfms_without_state = self._stateful_lag_tfms()
+            for attr in ("_sort_idxs", "_restore_idxs"):
+                if hasattr(self, attr):
+                    delattr(self, attr)
+
     def _update_y(self, new: np.ndarray) -> None:
         """Appends the elements of `new` to every time serie.
 
@@ -511,28 +881,53 @@ class TimeSeries:
         new_arr = np.asarray(new)
         self.ga = self.ga.append(new_arr)
 
-    def _update_features(self) -> DataFrame:
+    def _update_features(self) -> Dict[str, np.ndarray]:
         """Compute the current values of all the features using the latest values of the time series."""
         self.curr_dates: Union[pd.Index, pl_Series] = ufp.offset_times(
             self.curr_dates, self.freq, 1
         )
         self.test_dates.append(self.curr_dates)
 
-        features = self._compute_transforms(self.transforms, updates_only=True)
+        features = self._compute_transforms(self._batch_transforms, updates_only=True)
 
+        if self.date_features:
+            factorized = _factorize_dates(self.curr_dates)
         for feature in self.date_features:
-            feat_name, feat_vals = self._compute_date_feature(self.curr_dates, feature)
+            feat_name, feat_vals = self._compute_date_feature(
+                self.curr_dates, feature, factorized
+            )
+            if self._n_models > 1:
+                feat_vals = np.tile(np.asarray(feat_vals), self._n_models)
             features[feat_name] = feat_vals
+        return features
 
-        if isinstance(self.last_dates, pl_Series):
-            df_constructor = pl_DataFrame
-        else:
-            df_constructor = pd.DataFrame
-        features_df = df_constructor(features)[self.features]
-        return ufp.horizontal_concat([self._static_features, features_df])
+    def _predict_columns(self, df: DataFrame) -> Dict[str, Any]:
+        """Columns of `df` in the format used to build the inputs of the models.
+
+        These are numpy arrays when `as_numpy=True` (categoricals are converted to their codes),
+        pandas arrays for pandas dataframes and series for polars dataframes, which can all be indexed by position.
+        """
+        if len(df.columns) == 0:
+            return {}
+        if self.as_numpy:
+            values = ufp.to_numpy(df)
+            return {c: values[:, i] for i, c in enumerate(df.columns)}
+        if isinstance(df, pd.DataFrame):
+            return {c: df[c].array for c in df.columns}
+        return {c: df[c] for c in df.columns}
+
+    @staticmethod
+    def _null_masks(df: DataFrame) -> Dict[str, np.ndarray]:
+        """Rows with null values of each column of `df` that has any."""
+        if isinstance(df, pd.DataFrame):
+            nulls = df.isnull()
+            return {c: nulls[c].to_numpy() for c in df.columns if nulls[c].any()}
+        return {c: df[c].is_null().to_numpy() for c in df.columns if df[c].null_count()}
 
     def _get_raw_predictions(self) -> np.ndarray:
-        return np.array(self.y_pred).ravel("F")
+        """Predictions with one column per model in the batch, sorted by serie and timestep."""
+        preds = np.array(self.y_pred).reshape(len(self.y_pred), self._n_models, -1)
+        return preds.transpose(2, 0, 1).reshape(-1, self._n_models)
 
     def _get_future_ids(self, h: int):
         if isinstance(self._uids, pl_Series):
@@ -543,8 +938,10 @@ class TimeSeries:
             )
         return uids
 
-    def _get_predictions(self) -> DataFrame:
+    def _get_predictions(self, names: Optional[List[str]] = None) -> DataFrame:
         """Get all the predicted values with their corresponding ids and datestamps."""
+        if names is None:
+            names = [f"{self.target_col}_pred"]
         h = len(self.y_pred)
         if isinstance(self._uids, pl_Series):
             df_constructor = pl_DataFrame
@@ -555,45 +952,228 @@ class TimeSeries:
             {
                 self.id_col: uids,
                 self.time_col: np.array(self.test_dates).ravel("F"),
-                f"{self.target_col}_pred": self._get_raw_predictions(),
             },
         )
-        return df
+        return ufp.assign_columns(df, names, self._get_raw_predictions())
+
+    def _stateful_lag_tfms(self) -> List[str]:
+        """Names of the lag transforms whose updates depend on a state computed from the whole serie."""
+        return [
+            name
+            for name, tfm in self.transforms.items()
+            if isinstance(tfm, BaseLagTransform) and tfm._stateful
+        ]
+
+    def _advance_lag_tfms_states(
+        self, old_sizes: np.ndarray, new_groups: np.ndarray
+    ) -> None:
+        """Include the values appended to the series in the states of the stateful lag transforms.
+
+        The existing series are updated one value at a time, as when predicting, so their states keep
+        all their history even if only the last values are stored. The new series and the ones that didn't have
+        more values than the lags (whose states aren't defined) get theirs from all their values.
+        """
+        names = [
+            name
+            for name in self._stateful_lag_tfms()
+            if name not in getattr(self, "_lag_tfms_without_state", [])
+        ]
+        if not names:
+            return
+        indptr = self.ga.indptr
+        # each update only reads the last values of the series
+        lag_tfms = {
+            name: tfm
+            for name, tfm in self.transforms.items()
+            if name in names and isinstance(tfm, BaseLagTransform)
+        }
+        max_lag = max(tfm._core_tfm.lag for tfm in lag_tfms.values())
+        advanced = old_sizes > max_lag
+        groups_idxs = np.flatnonzero(~new_groups)[advanced]
+        starts = indptr[groups_idxs]
+        old_ends = starts + old_sizes[advanced]
+        n_appended = indptr[groups_idxs + 1] - old_ends
+        tfms = {
+            name: tfm.take(np.flatnonzero(advanced)) for name, tfm in lag_tfms.items()
+        }
+        for i in range(n_appended.max(initial=0)):
+            # the update that includes the i-th appended value is computed from the values before it
+            groups = np.flatnonzero(n_appended > i)
+            ends = old_ends[groups] + i
+            sizes = np.minimum(ends - starts[groups], max_lag)
+            sub_indptr = np.append(0, sizes.cumsum()).astype(indptr.dtype)
+            positions = np.arange(sub_indptr[-1]) + np.repeat(
+                ends - sizes - sub_indptr[:-1], sizes
+            )
+            core_ga = CoreGroupedArray(self.ga.data[positions], sub_indptr)
+            for tfm in tfms.values():
+                group_tfm = tfm.take(groups)
+                group_tfm.update(core_ga)
+                tfm.put(groups, group_tfm)
+        computed_idxs = np.setdiff1d(np.arange(self.ga.n_groups), groups_idxs)
+        if computed_idxs.size:
+            computed_ga = self.ga.take(computed_idxs)
+            core_ga = CoreGroupedArray(computed_ga.data, computed_ga.indptr)
+            # the states are stacked as (advanced series, computed series) and then sorted by serie
+            order = np.argsort(np.append(groups_idxs, computed_idxs))
+            for name, tfm in tfms.items():
+                computed_tfm = tfm.take(None)
+                computed_tfm.transform(core_ga)
+                tfms[name] = BaseLagTransform.stack([tfm, computed_tfm]).take(order)
+        self.transforms.update(tfms)
+
+    def _continue_lag_tfms_states(self, ts: "TimeSeries") -> None:
+        """Take the states of the stateful lag transforms from `ts`, whose series are the first values of these ones,
+        and advance them with the rest of the values instead of computing them from all of the series.
+        """
+        names = [
+            name
+            for name in getattr(self, "_lag_tfms_without_state", [])
+            if name not in getattr(ts, "_lag_tfms_without_state", [])
+        ]
+        if not names:
+            return
+        new_groups = ~np.isin(np.asarray(self.uids), np.asarray(ts.uids))
+        if new_groups.size - new_groups.sum() != len(ts.uids):
+            return
+        for name in names:
+            tfm = ts.transforms[name]
+            assert isinstance(tfm, BaseLagTransform)  # mypy
+            self.transforms[name] = tfm.take(None)
+        self._lag_tfms_without_state = [
+            name for name in self._lag_tfms_without_state if name not in names
+        ]
+        self._advance_lag_tfms_states(np.diff(ts.ga.indptr), new_groups)
+
+    def _compute_missing_lag_tfms_states(self) -> None:
+        if getattr(self, "_lag_tfms_without_state", None):
+            lag_tfms = {
+                name: self.transforms[name] for name in self._lag_tfms_without_state
+            }
+            self._compute_transforms(lag_tfms, updates_only=False)
+            self._lag_tfms_without_state = []
 
-    def _predict_setup(self) -> None:
-        self.ga = copy.copy(self._ga)
-        if isinstance(self.last_dates, pl_Series):
+    def _predict_static_columns(self) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+        """Static features used by the models and the null masks of the ones that have any.
+
+        These are computed once for all the series and kept until the static features change.
+        """
+        cached = getattr(self, "_static_columns_cache", None)
+        if (
+            cached is None
+            or cached[0] is not self.static_features_
+            or cached[1] != self.as_numpy
+        ):
+            features_order = set(self.features_order_)
+            columns = [c for c in self.static_features_.columns if c in features_order]
+            if isinstance(self.static_features_, pd.DataFrame):
+                statics = self.static_features_[columns]
+            else:
+                # indexing with an empty list takes no rows in polars
+                statics = self.static_features_.select(columns)
+            cached = (
+                self.static_features_,
+                self.as_numpy,
+                self._predict_columns(statics),
+                self._null_masks(statics),
+            )
+            self._static_columns_cache = cached
+        return cached[2], cached[3]
+
+    def _predict_setup(
+        self, n_models: int = 1, horizon: int = 0, X_df: Optional[DataFrame] = None
+    ) -> None:
+        self._compute_missing_lag_tfms_states()
+        # each serie is repeated once per model to update all of them in a single pass
+        self._n_models = n_models
+        idxs = self._idxs
+        if n_models > 1:
+            if idxs is None:
+                idxs = np.arange(self._ga.n_groups)
+            idxs = np.tile(idxs, n_models)
+        if horizon > 0:
+            # the predictions are written in place to the space reserved for the horizon
+            self.ga = self._ga.reserve(horizon, idxs)
+        elif idxs is not None:
+            self.ga = self._ga.take(idxs)
+        else:
+            # nothing gets appended, so the series are only read
+            self.ga = self._ga
+        # the lag transforms keep state which gets modified by the updates
+        self._batch_transforms = {
+            name: tfm.take(idxs) if isinstance(tfm, BaseLagTransform) else tfm
+            for name, tfm in self.transforms.items()
+        }
+        # the static and exogenous features are converted once and indexed at each timestep
+        static_columns, static_nulls = self._predict_static_columns()
+        if idxs is None:
+            self._static_columns = static_columns
+            self._static_nulls = list(static_nulls)
+        else:
+            self._static_columns = {
+                name: vals[idxs] for name, vals in static_columns.items()
+            }
+            self._static_nulls = [
+                name for name, mask in static_nulls.items() if mask[idxs].any()
+            ]
+        if X_df is None:
+            self._X_columns: Optional[Dict[str, Any]] = None
+            self._X_nulls: Dict[str, np.ndarray] = {}
+        else:
+            self._X_columns = self._predict_columns(X_df)
+            self._X_nulls = self._null_masks(X_df)
+        if self._idxs is not None:
+            self.curr_dates = self.last_dates[self._idxs]
+        elif isinstance(self.last_dates, pl_Series):
             self.curr_dates = self.last_dates.clone()
         else:
             self.curr_dates = self.last_dates.copy()
-        if self._idxs is not None:
-            self.ga = self.ga.take(self._idxs)
-            self.curr_dates = self.curr_dates[self._idxs]
         self.test_dates: List[Union[pd.Index, pl_Series]] = []
         self.y_pred = []
         self._h = 0
 
-    def _get_features_for_next_step(self, X_df=None):
-        new_x = self._update_features()
-        if X_df is not None:
-            n_series = len(self._uids)
-            h = X_df.shape[0] // n_series
-            rows = np.arange(self._h, X_df.shape[0], h)
-            X = ufp.take_rows(X_df, rows)
-            X = ufp.drop_index_if_pandas(X)
-            new_x = ufp.horizontal_concat([new_x, X])
-        if isinstance(new_x, pd.DataFrame):
-            nulls = new_x.isnull().any()
-            cols_with_nulls = nulls[nulls].index.tolist()
+    def _get_features_for_next_step(self) -> Union[DataFrame, np.ndarray]:
+        """Build the inputs of the models for the next timestep.
+
+        The columns are assembled as arrays and a single dataframe (or array if `as_numpy=True`) is built from them.
+        """
+        features = self._update_features()
+        is_pandas = isinstance(self.last_dates, pd.Index)
+        if is_pandas:
+            # the computed features are numpy arrays, which can't have nulls in polars
+            features_nulls = [
+                name for name in self.features if pd.isna(features[name]).any()
+            ]
         else:
-            nulls = new_x.select(pl.all().is_null().any())
-            cols_with_nulls = [k for k, v in nulls.to_dicts()[0].items() if v]
+            features_nulls = []
+        X_nulls = []
+        if self._X_columns is not None:
+            n_series = len(self._uids)
+            X_size = len(next(iter(self._X_columns.values())))
+            rows = np.arange(self._h, X_size, X_size // n_series)
+            if self._n_models > 1:
+                rows = np.tile(rows, self._n_models)
+            for name, vals in self._X_columns.items():
+                features[name] = vals[rows]
+            X_nulls = [name for name, mask in self._X_nulls.items() if mask[rows].any()]
+        cols_with_nulls = self._static_nulls + features_nulls + X_nulls
         if cols_with_nulls:
             warnings.warn(f'Found null values in {", ".join(cols_with_nulls)}.')
         self._h += 1
-        new_x = new_x[self.features_order_]
+        columns = {**self._static_columns, **features}
+        columns = {name: columns[name] for name in self.features_order_}
+        n_rows = len(self.curr_dates) * self._n_models
+        new_x: Union[DataFrame, np.ndarray]
         if self.as_numpy:
-            new_x = ufp.to_numpy(new_x)
+            dtype = np.result_type(*{vals.dtype for vals in columns.values()})
+            values = np.empty((n_rows, len(columns)), dtype=dtype)
+            for i, vals in enumerate(columns.values()):
+                values[:, i] = vals
+            new_x = values
+        elif is_pandas:
+            new_x = pd.DataFrame(columns, index=pd.RangeIndex(n_rows))
+        else:
+            new_x = pl_DataFrame(columns)
         return new_x
 
     def _predict_recursive(
@@ -604,25 +1184,29 @@ class TimeSeries:
         after_predict_callback: Optional[Callable] = None,
         X_df: Optional[DataFrame] = None,
     ) -> DataFrame:
-        """Use `model` to predict the next `horizon` timesteps."""
-        for i, (name, model) in enumerate(models.items()):
-            self._predict_setup()
-            for _ in range(horizon):
-                new_x = self._get_features_for_next_step(X_df)
+        """Use `models` to predict the next `horizon` timesteps."""
+        self._predict_setup(n_models=len(models), horizon=horizon, X_df=X_df)
+        n_series = len(self._uids)
+        for _ in range(horizon):
+            new_x = self._get_features_for_next_step()
+            batch_preds = []
+            for i, model in enumerate(models.values()):
+                if self._n_models > 1:
+                    rows = slice(i * n_series, (i + 1) * n_series)
+                    if isinstance(new_x, pd.DataFrame):
+                        model_x = new_x.iloc[rows].reset_index(drop=True)
+                    else:
+                        model_x = new_x[rows]
+                else:
+                    model_x = new_x
                 if before_predict_callback is not None:
-                    new_x = before_predict_callback(new_x)
-                predictions = model.predict(new_x)
+                    model_x = before_predict_callback(model_x)
+                predictions = model.predict(model_x)
                 if after_predict_callback is not None:
                     predictions = after_predict_callback(predictions)
-                self._update_y(predictions)
-            if i == 0:
-                preds = self._get_predictions()
-                rename_dict = {f"{self.target_col}_pred": name}
-                preds = ufp.rename(preds, rename_dict)
-            else:
-                raw_preds = self._get_raw_predictions()
-                preds = ufp.assign_columns(preds, name, raw_preds)
-        return preds
+                batch_preds.append(np.asarray(predictions))
+            self._update_y(np.concatenate(batch_preds))
+        return self._get_predictions(names=list(models.keys()))
 
     def _predict_multi(
         self,
@@ -636,7 +1220,7 @@ class TimeSeries:
             raise ValueError(
                 f"horizon must be at most max_horizon ({self.max_horizon})"
             )
-        self._predict_setup()
+        self._predict_setup(X_df=X_df)
         uids = self._get_future_ids(horizon)
         starts = ufp.offset_times(self.curr_dates, self.freq, 1)
         dates = ufp.time_ranges(starts, self.freq, periods=horizon)
@@ -645,18 +1229,44 @@ class TimeSeries:
         else:
             df_constructor = pd.DataFrame
         result = df_constructor({self.id_col: uids, self.time_col: dates})
-        for name, model in models.items():
-            self._predict_setup()
-            new_x = self._get_features_for_next_step(X_df)
-            if before_predict_callback is not None:
-                new_x = before_predict_callback(new_x)
-            predictions = np.empty((new_x.shape[0], horizon))
-            for i in range(horizon):
-                predictions[:, i] = model[i].predict(new_x)
-            raw_preds = predictions.ravel()
-            result = ufp.assign_columns(result, name, raw_preds)
+        # every model uses the same features, so we compute them once
+        new_x = self._get_features_for_next_step()
+        if before_predict_callback is not None:
+            new_x = before_predict_callback(new_x)
+        predictions = {name: np.empty((new_x.shape[0], horizon)) for name in models}
+
+        def predict_horizon(name: str, i: int) -> None:
+            predictions[name][:, i] = models[name][i].predict(new_x)
+
+        jobs = [(name, i) for name in models for i in range(horizon)]
+        if self.num_threads == 1:
+            for name, i in jobs:
+                predict_horizon(name, i)
+        else:
+            with concurrent.futures.ThreadPoolExecutor(self.num_threads) as executor:
+                futures = [
+                    executor.submit(predict_horizon, name, i) for name, i in jobs
+                ]
+                for future in futures:
+                    future.result()
+        for name in models:
+            result = ufp.assign_columns(result, name, predictions[name].ravel())
         return result
 
+    def _get_uids_index(self) -> pd.Index:
+        """Index of the ids. Its hash table is built the first time it's used and kept until the ids change."""
+        if isinstance(self.uids, pd.Index):
+            return self.uids
+        cached = getattr(self, "_uids_index", None)
+        if cached is None or cached[0] is not self.uids:
+            cached = self.uids, pd.Index(_uids_to_numpy(self.uids))
+            self._uids_index = cached
+        return cached[1]
+
+    def _uids_positions(self, ids: List[str]) -> np.ndarray:
+        """Sorted positions of `ids` in `uids`."""
+        return _ids_positions(self._get_uids_index(), ids, is_sorted=False)
+
     def _has_ga_target_tfms(self):
         return any(
             isinstance(tfm, BaseGroupedArrayTargetTransform)
@@ -673,20 +1283,12 @@ class TimeSeries:
         ids: Optional[List[str]] = None,
     ) -> DataFrame:
         if ids is not None:
-            unseen = set(ids) - set(self.uids)
-            if unseen:
-                raise ValueError(
-                    f"The following ids weren't seen during training and thus can't be forecasted: {unseen}"
-                )
-            self._idxs: Optional[np.ndarray] = np.where(ufp.is_in(self.uids, ids))[0]
+            self._idxs: Optional[np.ndarray] = self._uids_positions(ids)
             self._uids = self.uids[self._idxs]
-            self._static_features = ufp.take_rows(self.static_features_, self._idxs)
-            self._static_features = ufp.drop_index_if_pandas(self._static_features)
             last_dates = self.last_dates[self._idxs]
         else:
             self._idxs = None
             self._uids = self.uids
-            self._static_features = self.static_features_
             last_dates = self.last_dates
         if X_df is not None:
             if self.id_col not in X_df or self.time_col not in X_df:
@@ -729,9 +1331,9 @@ class TimeSeries:
                 raise ValueError(msg)
             drop_cols = [self.id_col, self.time_col, "_start", "_end"]
             X_df = ufp.sort(X_df, [self.id_col, self.time_col]).drop(columns=drop_cols)
-        # backup original series. the ga attribute gets modified
-        # and is copied from _ga at the start of each model's predict
-        self._ga = copy.copy(self.ga)
+        # backup original series. the ga attribute gets replaced by a copy
+        # of _ga in _predict_setup when values are appended, so _ga isn't modified
+        self._ga = self.ga
         try:
             if getattr(self, "max_horizon", None) is None:
                 preds = self._predict_recursive(
@@ -769,17 +1371,183 @@ class TimeSeries:
                     tfm.idxs = None
                 else:
                     preds = tfm.inverse_transform(preds)
-        del self._uids, self._idxs, self._static_features
+        del self._uids, self._idxs, self._batch_transforms
+        del self._static_columns, self._static_nulls, self._X_columns, self._X_nulls
         return preds
 
-    def save(self, path: Union[str, Path]) -> None:
-        with fsspec.open(path, "wb") as f:
-            cloudpickle.dump(self, f)
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        for cache in self._caches:
+            state.pop(cache, None)
+        return state
+
+    def __copy__(self) -> "TimeSeries":
+        # shallow copies share the caches
+        ts = self.__class__.__new__(self.__class__)
+        ts.__dict__.update(self.__dict__)
+        return ts
+
+    def save(self, path: Union[str, Path], binary: bool = False) -> None:
+        """Save the object to `path`.
+
+        If `binary=True`, `path` is a directory where the series values are stored as npy files,
+        which `TimeSeries.load` can memory-map. The ids, last dates, static features and state of the
+        lag transforms are stored by serie, so that `TimeSeries.load` can read only some of the series.
+        """
+        if not binary:
+            with fsspec.open(path, "wb") as f:
+                cloudpickle.dump(self, f)
+            return
+        fs, root = fsspec.core.url_to_fs(str(path))
+        for dirname in ("lag_transforms", "series"):
+            fs.makedirs(f"{root}/{dirname}", exist_ok=True)
+
+        def save_array(name: str, values: np.ndarray) -> None:
+            with fs.open(f"{root}/{name}.npy", "wb") as f:
+                np.save(f, values)
+
+        save_array("data", self.ga.data)
+        save_array("indptr", self.ga.indptr)
+        # ids index, used to find the position of each serie
+        uids = _uids_to_numpy(self.uids)
+        save_array("uids", uids)
+        ts = copy.copy(self)
+        # the series are saved separately
+        for attr in ("ga", "uids", "last_dates", "static_features_", *self._caches):
+            vars(ts).pop(attr, None)
+        # the lag transforms are pickled without their state, which is saved as arrays with one row per serie
+        ts.transforms = {}
+        lag_tfms_states: List[Tuple[str, str]] = []
+        for name, tfm in self.transforms.items():
+            if isinstance(tfm, BaseLagTransform):
+                for attr, values in vars(tfm._core_tfm).items():
+                    if isinstance(values, np.ndarray):
+                        save_array(f"lag_transforms/{len(lag_tfms_states)}", values)
+                        lag_tfms_states.append((name, attr))
+                tfm = tfm.take(np.empty(0, dtype=np.intp))
+            ts.transforms[name] = tfm
+        with fs.open(f"{root}/ts.pkl", "wb") as f:
+            cloudpickle.dump(ts, f)
+        n_series = len(self.uids)
+        for i, start in enumerate(range(0, n_series, self._series_block_size)):
+            idxs = np.arange(start, min(start + self._series_block_size, n_series))
+            block = {
+                "uids": self.uids[idxs],
+                "last_dates": self.last_dates[idxs],
+                "static_features_": ufp.take_rows(self.static_features_, idxs),
+            }
+            with fs.open(f"{root}/series/{i}.pkl", "wb") as f:
+                cloudpickle.dump(block, f)
+        # written last, so that its presence means that the directory is complete
+        manifest = {
+            "format_version": _BINARY_FORMAT_VERSION,
+            "n_series": n_series,
+            "series_block_size": self._series_block_size,
+            "uids_sorted": bool(np.all(uids[:-1] <= uids[1:])),
+            "lag_transforms_states": lag_tfms_states,
+        }
+        with fs.open(f"{root}/manifest.json", "w") as f:
+            json.dump(manifest, f)
 
     @staticmethod
-    def load(path: Union[str, Path], protocol: Optional[str] = None) -> "TimeSeries":
-        with fsspec.open(path, "rb", protocol=protocol) as f:
+    def load(
+        path: Union[str, Path],
+        protocol: Optional[str] = None,
+        mmap: bool = False,
+        ids: Optional[List[str]] = None,
+    ) -> "TimeSeries":
+        """Load an object saved with `TimeSeries.save`.
+
+        The following only work for objects saved with `binary=True`:
+        If `mmap=True`, the series values are memory-mapped (read-only) instead of read into memory,
+        which requires `path` to be in the local filesystem.
+        If `ids` is not None, only the data of these series is read."""
+        if protocol is None:
+            fs, root = fsspec.core.url_to_fs(str(path))
+        else:
+            fs, root = fsspec.filesystem(protocol), str(path)
+        if not fs.isdir(root):
+            if ids is not None:
+                raise ValueError("ids only works for objects saved with binary=True.")
+            with fs.open(root, "rb") as f:
+                return cloudpickle.load(f)
+        with fs.open(f"{root}/manifest.json", "r") as f:
+            manifest = json.load(f)
+        version = manifest["format_version"]
+        if version > _BINARY_FORMAT_VERSION:
+            raise ValueError(
+                f"{path} was saved with format version {version}, "
+                f"this version of mlforecast can read up to {_BINARY_FORMAT_VERSION}."
+            )
+        is_local = isinstance(fs, LocalFileSystem)
+        if mmap and not is_local:
+            raise ValueError("mmap=True requires a path in the local filesystem.")
+
+        def load_array(name: str) -> np.ndarray:
+            # a subset is taken from the memory-mapped file, which only reads the required values
+            if mmap or (ids is not None and is_local):
+                return np.load(f"{root}/{name}.npy", mmap_mode="r")
+            with fs.open(f"{root}/{name}.npy", "rb") as f:
+                return np.load(f)
+
+        with fs.open(f"{root}/ts.pkl", "rb") as f:
             ts = cloudpickle.load(f)
+        if ids is not None:
+            # the state of the target transformations is also taken for the selected series
+            unsupported = [
+                tfm.__class__.__name__
+                for tfm in ts.target_transforms or []
+                if isinstance(tfm, BaseGroupedArrayTargetTransform)
+                and type(tfm).take is BaseGroupedArrayTargetTransform.take
+            ]
+            if unsupported:
+                raise ValueError(
+                    f"ids requires target transformations that implement `take`, got: {unsupported}."
+                )
+        ga = GroupedArray(load_array("data"), load_array("indptr"))
+        n_series, block_size = manifest["n_series"], manifest["series_block_size"]
+        if ids is None:
+            idxs = None
+            blocks = np.arange(-(-n_series // block_size))
+        else:
+            if len(ids) == 0:
+                raise ValueError("ids must contain at least one id.")
+            idxs = _ids_positions(load_array("uids"), ids, manifest["uids_sorted"])
+            blocks = np.unique(idxs // block_size)
+        series = []
+        for block in blocks:
+            with fs.open(f"{root}/series/{block}.pkl", "rb") as f:
+                series.append(cloudpickle.load(f))
+        ts.uids = _concat_series([s["uids"] for s in series])
+        ts.last_dates = _concat_series([s["last_dates"] for s in series])
+        ts.static_features_ = _concat_series([s["static_features_"] for s in series])
+        if idxs is not None:
+            # all the blocks before the last one have block_size series
+            block_idxs = (
+                np.searchsorted(blocks, idxs // block_size) * block_size
+                + idxs % block_size
+            )
+            ts.uids = ts.uids[block_idxs]
+            ts.last_dates = ts.last_dates[block_idxs]
+            ts.static_features_ = ufp.drop_index_if_pandas(
+                ufp.take_rows(ts.static_features_, block_idxs)
+            )
+            ga = ga.take(idxs)
+        ts.ga = ga
+        for i, (name, attr) in enumerate(manifest["lag_transforms_states"]):
+            values = load_array(f"lag_transforms/{i}")
+            if idxs is not None:
+                values = values[idxs]
+            setattr(ts.transforms[name]._core_tfm, attr, values)
+        if idxs is not None:
+            if ts.target_transforms is not None:
+                ts.target_transforms = [
+                    tfm.take(idxs)
+                    if isinstance(tfm, BaseGroupedArrayTargetTransform)
+                    else tfm
+                    for tfm in ts.target_transforms
+                ]
+            ts._dropped_series = None
         return ts
 
     def update(self, df: DataFrame) -> None:
@@ -839,8 +1607,11 @@ class TimeSeries:
                 else:
                     df = tfm.update(df)
                 values = df[self.target_col].to_numpy()
+        old_sizes = np.diff(self.ga.indptr)
+        new_groups = new_groups.to_numpy()
         self.ga = self.ga.append_several(
             new_sizes=sizes["counts"].to_numpy().astype(np.int32),
             new_values=values,
-            new_groups=new_groups.to_numpy(),
+            new_groups=new_groups,
         )
+        self._advance_lag_tfms_states(old_sizes, new_groups)
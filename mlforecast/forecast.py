@@ -1,14 +1,29 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/forecast.ipynb.
 
 # %% auto 0
-__all__ = ['MLForecast']
+__all__ = ['MLForecast', 'Predictor']
 
 # %% ../nbs/forecast.ipynb 3
+import concurrent.futures
 import copy
 import re
+import threading
 import warnings
+from functools import partial
 from pathlib import Path
-from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 import cloudpickle
 import fsspec
@@ -26,28 +41,73 @@ from mlforecast.core import (
     Models,
     TargetTransform,
     TimeSeries,
+    _collect_sorted,
     _name_models,
 )
-from .grouped_array import GroupedArray
+from .grouped_array import ExpandedTarget, GroupedArray
 
 if TYPE_CHECKING:
     from mlforecast.lgb_cv import LightGBMCV
-from .target_transforms import BaseGroupedArrayTargetTransform
+from .target_transforms import BaseGroupedArrayTargetTransform, Differences
 from .utils import PredictionIntervals
 
 # %% ../nbs/forecast.ipynb 6
+def _quantile_indexes(
+    n: int, cuts: List[float]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Order statistics around each cut of a sample of size `n` and their interpolation weights,
+    computed in the same way as the linear method of `np.quantile`."""
+    virtual_indexes = (n - 1) * np.asarray(cuts, dtype=np.float64)
+    previous_indexes = np.floor(virtual_indexes)
+    gamma = virtual_indexes - previous_indexes
+    previous_indexes = previous_indexes.astype(np.intp)
+    next_indexes = np.minimum(previous_indexes + 1, n - 1)
+    return previous_indexes, next_indexes, gamma
+
+
+def _lerp(a: np.ndarray, b: np.ndarray, t: np.ndarray) -> np.ndarray:
+    """Linear interpolation between `a` and `b`, in the same way as `np.quantile`."""
+    diff_b_a = b - a
+    return np.where(t >= 0.5, b - diff_b_a * (1 - t), a + diff_b_a * t)
+
+
+def _conformal_arrays(
+    fcst_df: DataFrame,
+    sorted_scores: np.ndarray,
+    model_names: List[str],
+    horizon: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Sorted scores restricted to the horizon with shape (n_windows, n_series, horizon, n_models)
+    and forecasts with shape (n_series, horizon, n_models)."""
+    # the columns are copied one by one, which avoids converting multi-chunk polars frames at once
+    mean = np.empty((fcst_df.shape[0], len(model_names)))
+    for i, model in enumerate(model_names):
+        mean[:, i] = fcst_df[model].to_numpy()
+    mean = mean.reshape(sorted_scores.shape[1], -1, len(model_names))
+    return sorted_scores[:, :, :horizon], mean
+
+
+def _interval_columns(
+    model_names: List[str], level: List[Union[int, float]]
+) -> List[str]:
+    return [
+        f"{model}-{side}-{lv}"
+        for model in model_names
+        for side, levels in (("lo", reversed(level)), ("hi", level))
+        for lv in levels
+    ]
+
+# %% ../nbs/forecast.ipynb 7
 def _add_conformal_distribution_intervals(
     fcst_df: DataFrame,
-    cs_df: DataFrame,
+    sorted_scores: np.ndarray,
     model_names: List[str],
     level: List[Union[int, float]],
-    cs_n_windows: int,
-    cs_h: int,
-    n_series: int,
     horizon: int,
 ) -> DataFrame:
     """
-    Adds conformal intervals to a `fcst_df` based on conformal scores `cs_df`.
+    Adds conformal intervals to a `fcst_df` based on conformal scores `sorted_scores`
+    with shape (n_windows, n_series, h, n_models), sorted along the windows.
     `level` should be already sorted. This strategy creates forecasts paths
     based on errors and calculate quantiles using those paths.
     """
@@ -55,61 +115,64 @@ def _add_conformal_distribution_intervals(
     alphas = [100 - lv for lv in level]
     cuts = [alpha / 200 for alpha in reversed(alphas)]
     cuts.extend(1 - alpha / 200 for alpha in alphas)
-    for model in model_names:
-        scores = cs_df[model].to_numpy().reshape(cs_n_windows, n_series, cs_h)
-        # restrict scores to horizon
-        scores = scores[:, :, :horizon]
-        mean = fcst_df[model].to_numpy().reshape(1, n_series, -1)
-        scores = np.vstack([mean - scores, mean + scores])
-        quantiles = np.quantile(
-            scores,
-            cuts,
-            axis=0,
-        )
-        quantiles = quantiles.reshape(len(cuts), -1).T
-        lo_cols = [f"{model}-lo-{lv}" for lv in reversed(level)]
-        hi_cols = [f"{model}-hi-{lv}" for lv in level]
-        out_cols = lo_cols + hi_cols
-        fcst_df = ufp.assign_columns(fcst_df, out_cols, quantiles)
-    return fcst_df
+    sorted_scores, mean = _conformal_arrays(
+        fcst_df, sorted_scores, model_names, horizon
+    )
+    cs_n_windows, n_series = sorted_scores.shape[:2]
+    # the scores are absolute errors, so the sorted paths are the mean minus the scores in descending order
+    # followed by the mean plus the scores in ascending order. we take the order statistics of the paths
+    # from the ones of the scores instead of building the paths.
+    previous_indexes, next_indexes, gamma = _quantile_indexes(2 * cs_n_windows, cuts)
+    paths_idxs = np.concatenate([previous_indexes, next_indexes])
+    is_upper = paths_idxs >= cs_n_windows
+    scores_idxs = np.where(
+        is_upper, paths_idxs - cs_n_windows, cs_n_windows - 1 - paths_idxs
+    )
+    signs = np.where(is_upper, 1, -1).astype(sorted_scores.dtype).reshape(-1, 1, 1, 1)
+    paths = mean + signs * sorted_scores[scores_idxs]
+    n_cuts = len(cuts)
+    quantiles = _lerp(paths[:n_cuts], paths[n_cuts:], gamma.reshape(-1, 1, 1, 1))
+    # nans are sorted to the end. the scores can have a shorter horizon that is broadcasted
+    quantiles = np.where(np.isnan(sorted_scores[-1]), np.nan, quantiles)
+    # (cuts, series, horizon, models) -> (series * horizon, models * cuts)
+    quantiles = quantiles.transpose(1, 2, 3, 0).reshape(n_series * horizon, -1)
+    return ufp.assign_columns(fcst_df, _interval_columns(model_names, level), quantiles)
 
-# %% ../nbs/forecast.ipynb 7
+# %% ../nbs/forecast.ipynb 8
 def _add_conformal_error_intervals(
     fcst_df: DataFrame,
-    cs_df: DataFrame,
+    sorted_scores: np.ndarray,
     model_names: List[str],
     level: List[Union[int, float]],
-    cs_n_windows: int,
-    cs_h: int,
-    n_series: int,
     horizon: int,
 ) -> DataFrame:
     """
-    Adds conformal intervals to a `fcst_df` based on conformal scores `cs_df`.
+    Adds conformal intervals to a `fcst_df` based on conformal scores `sorted_scores`
+    with shape (n_windows, n_series, h, n_models), sorted along the windows.
     `level` should be already sorted. This startegy creates prediction intervals
     based on the absolute errors.
     """
     fcst_df = ufp.copy_if_pandas(fcst_df, deep=False)
     cuts = [lv / 100 for lv in level]
-    for model in model_names:
-        mean = fcst_df[model].to_numpy().ravel()
-        scores = cs_df[model].to_numpy().reshape(cs_n_windows, n_series, cs_h)
-        # restrict scores to horizon
-        scores = scores[:, :, :horizon]
-        quantiles = np.quantile(
-            scores,
-            cuts,
-            axis=0,
-        )
-        quantiles = quantiles.reshape(len(cuts), -1)
-        lo_cols = [f"{model}-lo-{lv}" for lv in reversed(level)]
-        hi_cols = [f"{model}-hi-{lv}" for lv in level]
-        quantiles = np.vstack([mean - quantiles[::-1], mean + quantiles]).T
-        columns = lo_cols + hi_cols
-        fcst_df = ufp.assign_columns(fcst_df, columns, quantiles)
-    return fcst_df
+    sorted_scores, mean = _conformal_arrays(
+        fcst_df, sorted_scores, model_names, horizon
+    )
+    cs_n_windows, n_series = sorted_scores.shape[:2]
+    previous_indexes, next_indexes, gamma = _quantile_indexes(cs_n_windows, cuts)
+    # the scores can be stored with less precision, the quantiles are computed with float64
+    quantiles = _lerp(
+        sorted_scores[previous_indexes].astype(np.float64),
+        sorted_scores[next_indexes].astype(np.float64),
+        gamma.reshape(-1, 1, 1, 1),
+    )
+    # nans are sorted to the end
+    quantiles[:, np.isnan(sorted_scores[-1])] = np.nan
+    intervals = np.concatenate([mean - quantiles[::-1], mean + quantiles])
+    # (cuts, series, horizon, models) -> (series * horizon, models * cuts)
+    intervals = intervals.transpose(1, 2, 3, 0).reshape(n_series * horizon, -1)
+    return ufp.assign_columns(fcst_df, _interval_columns(model_names, level), intervals)
 
-# %% ../nbs/forecast.ipynb 8
+# %% ../nbs/forecast.ipynb 9
 def _get_conformal_method(method: str):
     available_methods = {
         "conformal_distribution": _add_conformal_distribution_intervals,
@@ -122,7 +185,74 @@ def _get_conformal_method(method: str):
         )
     return available_methods[method]
 
-# %% ../nbs/forecast.ipynb 10
+# %% ../nbs/forecast.ipynb 13
+def _batches_to_memmap(
+    batches: Iterable[Tuple[Union[DataFrame, np.ndarray], np.ndarray]],
+    directory: Union[str, Path],
+) -> Tuple[np.memmap, np.memmap]:
+    """Write the features and target of each batch to files in `directory` and map them to memory."""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    X_path = directory / "X.bin"
+    y_path = directory / "y.bin"
+    n_rows = 0
+    X_dtype: Optional[np.dtype] = None
+    y_dtype: Optional[np.dtype] = None
+    n_cols = 0
+    y_shape: Tuple[int, ...] = ()
+    with open(X_path, "wb") as X_file, open(y_path, "wb") as y_file:
+        for X, y in batches:
+            if not isinstance(X, np.ndarray):
+                X = ufp.to_numpy(X)
+            if X_dtype is None:
+                X_dtype, y_dtype = X.dtype, y.dtype
+                n_cols, y_shape = X.shape[1], y.shape[1:]
+            # the rows are appended one after the other, so we write them in C order
+            np.ascontiguousarray(X, dtype=X_dtype).tofile(X_file)
+            np.ascontiguousarray(y, dtype=y_dtype).tofile(y_file)
+            n_rows += X.shape[0]
+    if n_rows == 0:
+        raise ValueError("There are no rows to write.")
+    assert X_dtype is not None and y_dtype is not None  # mypy
+    X = np.memmap(X_path, dtype=X_dtype, mode="r", shape=(n_rows, n_cols))
+    y = np.memmap(y_path, dtype=y_dtype, mode="r", shape=(n_rows, *y_shape))
+    return X, y
+
+# %% ../nbs/forecast.ipynb 14
+def _group_cv_windows(windows: Iterable[Tuple]) -> Iterator[List[Tuple]]:
+    """Group the cross validation windows, starting a new group at each one that refits the models."""
+    group: List[Tuple] = []
+    for window in windows:
+        should_fit = window[1]
+        if should_fit and group:
+            yield group
+            group = []
+        group.append(window)
+    if group:
+        yield group
+
+# %% ../nbs/forecast.ipynb 15
+def _shares_memory(obj: Any, arr: np.ndarray, seen: Optional[Set[int]] = None) -> bool:
+    """Whether `obj` is an array that can share memory with `arr` or holds one in its attributes or items."""
+    if isinstance(obj, np.ndarray):
+        return np.may_share_memory(obj, arr)
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return False
+    seen.add(id(obj))
+    children: Iterable[Any]
+    if isinstance(obj, dict):
+        children = obj.values()
+    elif isinstance(obj, (list, tuple)):
+        children = obj
+    elif hasattr(obj, "__dict__"):
+        children = vars(obj).values()
+    else:
+        return False
+    return any(_shares_memory(child, arr, seen) for child in children)
+
+# %% ../nbs/forecast.ipynb 16
 class MLForecast:
     def __init__(
         self,
@@ -134,6 +264,7 @@ class MLForecast:
         num_threads: int = 1,
         target_transforms: Optional[List[TargetTransform]] = None,
         lag_transforms_namer: Optional[Callable] = None,
+        dtype: Optional[Union[str, np.dtype]] = None,
     ):
         """Forecasting pipeline
 
@@ -151,10 +282,14 @@ class MLForecast:
             Features computed from the dates. Can be pandas date attributes or functions that will take the dates as input.
         num_threads : int (default=1)
             Number of threads to use when computing the features.
+            When training one model per horizon it's also used to train them and compute their predictions in parallel.
         target_transforms : list of transformers, optional(default=None)
             Transformations that will be applied to the target before computing the features and restored after the forecasting step.
         lag_transforms_namer : callable, optional(default=None)
             Function that takes a transformation (either function or class), a lag and extra arguments and produces a name.
+        dtype : str or numpy dtype, optional (default=None)
+            Floating point type used to store the series and compute the features, e.g. 'float32'.
+            If None, the type of the target is kept.
         """
         if not isinstance(models, dict) and not isinstance(models, list):
             models = [models]
@@ -172,6 +307,7 @@ class MLForecast:
             num_threads=num_threads,
             target_transforms=target_transforms,
             lag_transforms_namer=lag_transforms_namer,
+            dtype=dtype,
         )
 
     def __repr__(self):
@@ -214,13 +350,14 @@ class MLForecast:
         max_horizon: Optional[int] = None,
         return_X_y: bool = False,
         as_numpy: bool = False,
+        memmap_dir: Optional[Union[str, Path]] = None,
     ) -> Union[DataFrame, Tuple[DataFrame, np.ndarray]]:
         """Add the features to `data`.
 
         Parameters
         ----------
-        df : pandas DataFrame
-            Series data in long format.
+        df : pandas or polars DataFrame, polars LazyFrame, pyarrow Dataset or path to parquet files
+            Series data in long format. The last three are read with polars sorted by id and time.
         id_col : str (default='unique_id')
             Column that identifies each serie.
         time_col : str (default='ds')
@@ -239,12 +376,64 @@ class MLForecast:
             Return a tuple with the features and the target. If False will return a single dataframe.
         as_numpy : bool (default = False)
             Cast features to numpy array. Only works for `return_X_y=True`.
+        memmap_dir : str or Path, optional (default=None)
+            Directory where the features and target are written by batches of series, which are then returned as memory-mapped arrays.
+            Only works for `return_X_y=True`. The features are always a numpy array, regardless of `as_numpy`.
 
         Returns
         -------
         result : DataFrame or tuple of pandas Dataframe and a numpy array.
             `df` plus added features and target(s).
         """
+        prep = self._preprocess(
+            df=df,
+            id_col=id_col,
+            time_col=time_col,
+            target_col=target_col,
+            static_features=static_features,
+            dropna=dropna,
+            keep_last_n=keep_last_n,
+            max_horizon=max_horizon,
+            return_X_y=return_X_y,
+            as_numpy=as_numpy,
+            memmap_dir=memmap_dir,
+        )
+        if isinstance(prep, tuple) and isinstance(prep[1], ExpandedTarget):
+            X, y = prep
+            prep = X, np.asarray(y)
+        return prep
+
+    def _preprocess(
+        self,
+        df: DataFrame,
+        id_col: str,
+        time_col: str,
+        target_col: str,
+        static_features: Optional[List[str]],
+        dropna: bool,
+        keep_last_n: Optional[int],
+        max_horizon: Optional[int],
+        return_X_y: bool,
+        as_numpy: bool,
+        memmap_dir: Optional[Union[str, Path]],
+    ) -> Union[DataFrame, Tuple[DataFrame, Union[np.ndarray, ExpandedTarget]]]:
+        """Same as `preprocess`, but with `max_horizon` the target is an `ExpandedTarget` which is expanded by `fit_models`."""
+        df = _collect_sorted(df, id_col, time_col)
+        if memmap_dir is not None:
+            if not return_X_y:
+                raise ValueError("memmap_dir only works for return_X_y=True.")
+            batches = self.preprocess_iter(
+                df,
+                id_col=id_col,
+                time_col=time_col,
+                target_col=target_col,
+                static_features=static_features,
+                dropna=dropna,
+                keep_last_n=keep_last_n,
+                max_horizon=max_horizon,
+                as_numpy=True,
+            )
+            return _batches_to_memmap(batches, memmap_dir)
         return self.ts.fit_transform(
             df,
             id_col=id_col,
@@ -258,6 +447,69 @@ class MLForecast:
             as_numpy=as_numpy,
         )
 
+    def preprocess_iter(
+        self,
+        df: DataFrame,
+        id_col: str = "unique_id",
+        time_col: str = "ds",
+        target_col: str = "y",
+        static_features: Optional[List[str]] = None,
+        dropna: bool = True,
+        keep_last_n: Optional[int] = None,
+        max_horizon: Optional[int] = None,
+        as_numpy: bool = False,
+        batch_series: int = 1_000,
+    ) -> Iterator[Tuple[Union[DataFrame, np.ndarray], np.ndarray]]:
+        """Compute the features and target by batches of series.
+
+        Parameters
+        ----------
+        df : pandas or polars DataFrame, polars LazyFrame, pyarrow Dataset or path to parquet files
+            Series data in long format. The last three are read with polars sorted by id and time.
+        id_col : str (default='unique_id')
+            Column that identifies each serie.
+        time_col : str (default='ds')
+            Column that identifies each timestep, its values can be timestamps or integers.
+        target_col : str (default='y')
+            Column that contains the target.
+        static_features : list of str, optional (default=None)
+            Names of the features that are static and will be repeated when forecasting.
+        dropna : bool (default=True)
+            Drop rows with missing values produced by the transformations.
+        keep_last_n : int, optional (default=None)
+            Keep only these many records from each serie for the forecasting step. Can save time and memory if your features allow it.
+        max_horizon : int, optional (default=None)
+            Train this many models, where each model will predict a specific horizon.
+        as_numpy : bool (default = False)
+            Cast features to numpy array.
+        batch_series : int (default=1_000)
+            Number of series in each batch.
+
+        Returns
+        -------
+        result : generator of tuples of features and target
+            Features and target(s) of each batch of series, sorted by id and time.
+        """
+        df = _collect_sorted(df, id_col, time_col)
+        self.ts.dropna = dropna
+        self.ts.as_numpy = as_numpy
+        self.ts._fit(
+            df=df,
+            id_col=id_col,
+            time_col=time_col,
+            target_col=target_col,
+            static_features=static_features,
+            keep_last_n=keep_last_n,
+        )
+        for X, y in self.ts._transform_iter(
+            df,
+            batch_series=batch_series,
+            dropna=dropna,
+            max_horizon=max_horizon,
+            as_numpy=as_numpy,
+        ):
+            yield X, np.asarray(y)
+
     def fit_models(
         self,
         X: Union[DataFrame, np.ndarray],
@@ -278,23 +530,57 @@ class MLForecast:
             Forecast object with trained models.
         """
         self.models_: Dict[str, Union[BaseEstimator, List[BaseEstimator]]] = {}
-        for name, model in self.models.items():
-            if y.ndim == 2 and y.shape[1] > 1:
-                self.models_[name] = []
-                for col in range(y.shape[1]):
-                    keep = ~np.isnan(y[:, col])
-                    if isinstance(X, np.ndarray):
-                        # TODO: migrate to utils
-                        Xh = X[keep]
-                    else:
-                        Xh = ufp.filter_with_mask(X, keep)
-                    yh = y[keep, col]
-                    self.models_[name].append(clone(model).fit(Xh, yh))
-            else:
+        if not (y.ndim == 2 and y.shape[1] > 1):
+            if isinstance(y, ExpandedTarget):
+                # the estimators only take arrays
+                y = y[:, 0]
+            for name, model in self.models.items():
                 self.models_[name] = clone(model).fit(X, y)
+            return self
+
+        # one model per horizon, trained on the rows where its target is available.
+        # when X is an array these rows are written to a buffer that each thread reuses
+        local = threading.local()
+
+        def fit_horizon(job: Tuple[str, int]) -> BaseEstimator:
+            name, col = job
+            yh = y[:, col]
+            keep = ~np.isnan(yh)
+            if keep.all():
+                return clone(self.models[name]).fit(X, yh)
+            idxs = np.flatnonzero(keep)
+            if not isinstance(X, np.ndarray):
+                return clone(self.models[name]).fit(ufp.take_rows(X, idxs), yh[idxs])
+            buffer = getattr(local, "buffer", None)
+            if buffer is None or buffer.size < idxs.size * X.shape[1]:
+                buffer = np.empty(idxs.size * X.shape[1], dtype=X.dtype)
+            # np.take makes temporary copies of inputs and outputs that aren't C-contiguous,
+            # so for fortran ordered features we take the rows of each column
+            Xh = buffer[: idxs.size * X.shape[1]]
+            if X.flags.f_contiguous and not X.flags.c_contiguous:
+                Xh = Xh.reshape((idxs.size, X.shape[1]), order="F")
+                for j in range(X.shape[1]):
+                    np.take(X[:, j], idxs, out=Xh[:, j], mode="clip")
+            else:
+                Xh = Xh.reshape(idxs.size, X.shape[1])
+                np.take(X, idxs, axis=0, out=Xh, mode="clip")
+            model = clone(self.models[name]).fit(Xh, yh[idxs])
+            # models that keep a reference to their training data, also nested ones like the steps
+            # of a pipeline, keep the buffer and the thread allocates a new one
+            local.buffer = None if _shares_memory(model, buffer) else buffer
+            return model
+
+        jobs = [(name, col) for name in self.models for col in range(y.shape[1])]
+        if self.ts.num_threads == 1:
+            horizon_models = [fit_horizon(job) for job in jobs]
+        else:
+            with concurrent.futures.ThreadPoolExecutor(self.ts.num_threads) as executor:
+                horizon_models = list(executor.map(fit_horizon, jobs))
+        for (name, _), model in zip(jobs, horizon_models):
+            self.models_.setdefault(name, []).append(model)
         return self
 
-    def _conformity_scores(
+    def _conformity_cv(
         self,
         df: DataFrame,
         id_col: str,
@@ -303,12 +589,14 @@ class MLForecast:
         static_features: Optional[List[str]] = None,
         dropna: bool = True,
         keep_last_n: Optional[int] = None,
-        max_horizon: Optional[int] = None,
         n_windows: int = 2,
         h: int = 1,
         as_numpy: bool = False,
-    ):
-        """Compute conformity scores.
+        features: Optional[
+            Tuple[Union[DataFrame, np.ndarray], np.ndarray, np.ndarray]
+        ] = None,
+    ) -> DataFrame:
+        """Cross validation results used to compute the conformity scores.
 
         We need at least two cross validation errors to compute
         quantiles for prediction intervals (`n_windows=2`).
@@ -317,28 +605,102 @@ class MLForecast:
 
         In this simplest case, we assume the width of the interval
         is the same for all the forecasting horizon (`h=1`).
+
+        The models are trained once on the data before the first window (from `features` if provided)
+        and then used to predict each window.
         """
-        cv_results = self.cross_validation(
-            df=df,
+        splits = ufp.backtest_splits(
+            df,
             n_windows=n_windows,
             h=h,
-            refit=False,
+            id_col=id_col,
+            time_col=time_col,
+            freq=self.freq,
+        )
+        windows = (
+            (i_window, i_window == 0, cutoffs, train, valid)
+            for i_window, (cutoffs, train, valid) in enumerate(splits)
+        )
+        # evaluated by a copy so that its models don't end up in the `cv_models_` of this object
+        results = self._cv_copy()._cross_validation_windows(
+            df=df,
+            windows=windows,
+            features=features,
+            h=h,
             id_col=id_col,
             time_col=time_col,
             target_col=target_col,
             static_features=static_features,
             dropna=dropna,
             keep_last_n=keep_last_n,
-            max_horizon=max_horizon,
+            max_horizon=None,
+            before_predict_callback=None,
+            after_predict_callback=None,
             prediction_intervals=None,
+            level=None,
+            fitted=False,
             as_numpy=as_numpy,
         )
-        # conformity score for each model
-        for model in self.models.keys():
+        return ufp.vertical_concat(results, match_categories=False)
+
+    def _conformity_scores(
+        self,
+        cv_results: DataFrame,
+        id_col: str,
+        time_col: str,
+        target_col: str,
+        n_windows: int,
+        h: int,
+        sort: bool,
+    ) -> np.ndarray:
+        """Absolute errors of each model in the cross validation windows with shape (n_windows, n_series, h, n_models).
+
+        The series are in the same order as the ones in `self.ts` and the errors are sorted along the windows
+        (with the missing values at the end), so the intervals don't have to sort them at predict time.
+        """
+        missing_cols = [
+            c
+            for c in [id_col, time_col, target_col, *self.models.keys()]
+            if c not in cv_results.columns
+        ]
+        if missing_cols:
+            raise ValueError(
+                f"The following columns are missing from cv_results: {missing_cols}."
+            )
+        n_series = len(self.ts.uids)
+        sizes = ufp.counts_by_id(cv_results, id_col)["counts"].to_numpy()
+        if sizes.size != n_series or (sizes != n_windows * h).any():
+            raise ValueError(
+                f"cv_results must have {n_windows * h} rows (n_windows * h) for each of the {n_series} series, "
+                "please run cross_validation with the same `n_windows` and `h` as `prediction_intervals`."
+            )
+        cv_results = ufp.drop_index_if_pandas(cv_results)
+        rows: Optional[np.ndarray] = None
+        if sort:
+            # the sorted rows are grouped by serie, the scores are grouped by window
+            sort_idxs = ufp.maybe_compute_sort_indices(cv_results, id_col, time_col)
+            if sort_idxs is None:
+                sort_idxs = np.arange(cv_results.shape[0])
+            rows = sort_idxs.reshape(n_series, n_windows, h).transpose(1, 0, 2).ravel()
+        first_rows = np.arange(0, n_series * h, h)
+        uids = ufp.take_rows(
+            cv_results[id_col], first_rows if rows is None else rows[first_rows]
+        )
+        if not np.array_equal(np.asarray(uids), np.asarray(self.ts.uids)):
+            raise ValueError(
+                "cv_results must have the same series as the training data."
+            )
+        y = cv_results[target_col].to_numpy()
+        scores = np.empty(
+            (n_series * n_windows * h, len(self.models)), dtype=np.float32
+        )
+        for i, model in enumerate(self.models.keys()):
             # compute absolute error for each model
-            abs_err = abs(cv_results[model] - cv_results[target_col])
-            cv_results = ufp.assign_columns(cv_results, model, abs_err)
-        return cv_results.drop(columns=target_col)
+            abs_err = np.abs(cv_results[model].to_numpy() - y)
+            scores[:, i] = abs_err if rows is None else abs_err[rows]
+        scores = scores.reshape(n_windows, n_series, h, len(self.models))
+        scores.sort(axis=0)
+        return scores
 
     def _invert_transforms_fitted(self, df: pd.DataFrame) -> pd.DataFrame:
         if self.ts.target_transforms is None:
@@ -448,13 +810,15 @@ class MLForecast:
         prediction_intervals: Optional[PredictionIntervals] = None,
         fitted: bool = False,
         as_numpy: bool = False,
+        memmap_dir: Optional[Union[str, Path]] = None,
+        cv_results: Optional[DataFrame] = None,
     ) -> "MLForecast":
         """Apply the feature engineering and train the models.
 
         Parameters
         ----------
-        df : pandas or polars DataFrame
-            Series data in long format.
+        df : pandas or polars DataFrame, polars LazyFrame, pyarrow Dataset or path to parquet files
+            Series data in long format. The last three are read with polars sorted by id and time.
         id_col : str (default='unique_id')
             Column that identifies each serie.
         time_col : str (default='ds')
@@ -476,64 +840,135 @@ class MLForecast:
             Save in-sample predictions.
         as_numpy : bool (default = False)
             Cast features to numpy array.
+        memmap_dir : str or Path, optional (default=None)
+            Directory where the features and target are written by batches of series, so that the models are trained from memory-mapped arrays.
+            Doesn't work with `fitted=True`. The models are trained on a numpy array of features, regardless of `as_numpy`.
+        cv_results : pandas or polars DataFrame, optional (default=None)
+            Output of `cross_validation` on `df` with the same `n_windows` and `h` as `prediction_intervals`, used to compute the conformity scores.
+                If `None`, the models are trained on the data before the windows to compute them.
 
         Returns
         -------
         self : MLForecast
             Forecast object with series values and trained models.
         """
+        df = _collect_sorted(df, id_col, time_col)
+        if memmap_dir is not None and fitted:
+            raise ValueError("memmap_dir does not work with fitted=True.")
         if fitted and self.ts.target_transforms is not None:
             for tfm in self.ts.target_transforms:
                 if hasattr(tfm, "store_fitted"):
                     tfm.store_fitted = True
-        self._cs_df: Optional[DataFrame] = None
+        self._cs_scores: Optional[np.ndarray] = None
+        # the features of each row only depend on the previous values of its serie, so the ones
+        # used to compute the conformity scores are computed once and reused to train the final models
+        reuse_features = (
+            prediction_intervals is not None
+            and cv_results is None
+            and keep_last_n is None
+            and all(
+                isinstance(tfm, Differences) for tfm in self.ts.target_transforms or []
+            )
+        )
+        if reuse_features:
+            features = self._cv_features(
+                df,
+                id_col=id_col,
+                time_col=time_col,
+                target_col=target_col,
+                static_features=static_features,
+                dropna=dropna,
+                as_numpy=as_numpy,
+            )
+        else:
+            features = None
         if prediction_intervals is not None:
             self.prediction_intervals = prediction_intervals
-            self._cs_df = self._conformity_scores(
-                df=df,
+            sort_cv_results = cv_results is not None
+            if cv_results is None:
+                cv_results = self._conformity_cv(
+                    df=df,
+                    id_col=id_col,
+                    time_col=time_col,
+                    target_col=target_col,
+                    static_features=static_features,
+                    dropna=dropna,
+                    keep_last_n=keep_last_n,
+                    n_windows=prediction_intervals.n_windows,
+                    h=prediction_intervals.h,
+                    as_numpy=as_numpy,
+                    features=features,
+                )
+        if (
+            features is not None
+            and max_horizon is None
+            and not fitted
+            and memmap_dir is None
+        ):
+            all_X, all_y, keep = features
+            if isinstance(all_X, np.ndarray):
+                X = all_X[keep]
+            else:
+                X = ufp.filter_with_mask(all_X, keep)
+            del features, all_X
+            self._fit_from_features(
+                df,
+                X=X,
+                y=all_y[keep],
+                keep=keep,
                 id_col=id_col,
                 time_col=time_col,
                 target_col=target_col,
                 static_features=static_features,
                 dropna=dropna,
-                keep_last_n=keep_last_n,
-                n_windows=prediction_intervals.n_windows,
-                h=prediction_intervals.h,
                 as_numpy=as_numpy,
             )
-        prep = self.preprocess(
-            df=df,
-            id_col=id_col,
-            time_col=time_col,
-            target_col=target_col,
-            static_features=static_features,
-            dropna=dropna,
-            keep_last_n=keep_last_n,
-            max_horizon=max_horizon,
-            return_X_y=not fitted,
-            as_numpy=as_numpy,
-        )
-        if isinstance(prep, tuple):
-            X, y = prep
         else:
-            base = prep[[id_col, time_col]]
-            X, y = self._extract_X_y(prep, target_col)
-            if as_numpy:
-                X = ufp.to_numpy(X)
-            del prep
-        self.fit_models(X, y)
-        if fitted:
-            fitted_values = self._compute_fitted_values(
-                base=base,
-                X=X,
-                y=y,
+            del features
+            prep = self._preprocess(
+                df=df,
                 id_col=id_col,
                 time_col=time_col,
                 target_col=target_col,
+                static_features=static_features,
+                dropna=dropna,
+                keep_last_n=keep_last_n,
                 max_horizon=max_horizon,
+                return_X_y=not fitted,
+                as_numpy=as_numpy,
+                memmap_dir=memmap_dir,
+            )
+            if isinstance(prep, tuple):
+                X, y = prep
+            else:
+                base = prep[[id_col, time_col]]
+                X, y = self._extract_X_y(prep, target_col)
+                if as_numpy:
+                    X = ufp.to_numpy(X)
+                del prep
+            self.fit_models(X, y)
+            if fitted:
+                fitted_values = self._compute_fitted_values(
+                    base=base,
+                    X=X,
+                    y=y,
+                    id_col=id_col,
+                    time_col=time_col,
+                    target_col=target_col,
+                    max_horizon=max_horizon,
+                )
+                fitted_values = ufp.drop_index_if_pandas(fitted_values)
+                self.fcst_fitted_values_ = fitted_values
+        if prediction_intervals is not None:
+            self._cs_scores = self._conformity_scores(
+                cv_results,
+                id_col=id_col,
+                time_col=time_col,
+                target_col=target_col,
+                n_windows=prediction_intervals.n_windows,
+                h=prediction_intervals.h,
+                sort=sort_cv_results,
             )
-            fitted_values = ufp.drop_index_if_pandas(fitted_values)
-            self.fcst_fitted_values_ = fitted_values
         return self
 
     def forecast_fitted_values(
@@ -675,6 +1110,7 @@ class MLForecast:
                 num_threads=self.ts.num_threads,
                 target_transforms=self.ts.target_transforms,
                 lag_transforms_namer=self.ts.lag_transforms_namer,
+                dtype=getattr(self.ts, "dtype", None),
             )
             new_ts._fit(
                 new_df,
@@ -699,7 +1135,7 @@ class MLForecast:
             ids=ids,
         )
         if level is not None:
-            if self._cs_df is None:
+            if self._cs_scores is None:
                 warn_msg = (
                     "Please rerun the `fit` method passing a proper value "
                     "to prediction intervals to compute them."
@@ -729,118 +1165,158 @@ class MLForecast:
                     self.prediction_intervals.method
                 )
                 if ids is not None:
-                    ids_mask = ufp.is_in(self._cs_df[self.ts.id_col], ids)
-                    cs_df = ufp.filter_with_mask(self._cs_df, ids_mask)
-                    n_series = len(ids)
+                    sorted_scores = self._cs_scores[:, self.ts._uids_positions(ids)]
                 else:
-                    cs_df = self._cs_df
-                    n_series = self.ts.ga.n_groups
+                    sorted_scores = self._cs_scores
                 forecasts = conformal_method(
                     forecasts,
-                    cs_df,
+                    sorted_scores,
                     model_names=list(model_names),
                     level=level_,
-                    cs_h=self.prediction_intervals.h,
-                    cs_n_windows=self.prediction_intervals.n_windows,
-                    n_series=n_series,
                     horizon=h,
                 )
         return forecasts
 
-    def cross_validation(
+    def _new_ts(self) -> TimeSeries:
+        """TimeSeries with the same configuration and its own copy of the transformations."""
+        return TimeSeries(
+            freq=self.ts.freq,
+            lags=self.ts.lags,
+            lag_transforms=copy.deepcopy(self.ts.lag_transforms),
+            date_features=self.ts.date_features,
+            num_threads=self.ts.num_threads,
+            target_transforms=copy.deepcopy(self.ts.target_transforms),
+            lag_transforms_namer=self.ts.lag_transforms_namer,
+            dtype=getattr(self.ts, "dtype", None),
+        )
+
+    def _cv_features(
         self,
         df: DataFrame,
-        n_windows: int,
-        h: int,
-        id_col: str = "unique_id",
-        time_col: str = "ds",
-        target_col: str = "y",
-        step_size: Optional[int] = None,
-        static_features: Optional[List[str]] = None,
-        dropna: bool = True,
-        keep_last_n: Optional[int] = None,
-        refit: Union[bool, int] = True,
-        max_horizon: Optional[int] = None,
-        before_predict_callback: Optional[Callable] = None,
-        after_predict_callback: Optional[Callable] = None,
-        prediction_intervals: Optional[PredictionIntervals] = None,
-        level: Optional[List[Union[int, float]]] = None,
-        input_size: Optional[int] = None,
-        fitted: bool = False,
-        as_numpy: bool = False,
-    ) -> DataFrame:
-        """Perform time series cross validation.
-        Creates `n_windows` splits where each window has `h` test periods,
-        trains the models, computes the predictions and merges the actuals.
-
-        Parameters
-        ----------
-        df : pandas or polars DataFrame
-            Series data in long format.
-        n_windows : int
-            Number of windows to evaluate.
-        h : int
-            Forecast horizon.
-        id_col : str (default='unique_id')
-            Column that identifies each serie.
-        time_col : str (default='ds')
-            Column that identifies each timestep, its values can be timestamps or integers.
-        target_col : str (default='y')
-            Column that contains the target.
-        step_size : int, optional (default=None)
-            Step size between each cross validation window. If None it will be equal to `h`.
-        static_features : list of str, optional (default=None)
-            Names of the features that are static and will be repeated when forecasting.
-        dropna : bool (default=True)
-            Drop rows with missing values produced by the transformations.
-        keep_last_n : int, optional (default=None)
-            Keep only these many records from each serie for the forecasting step. Can save time and memory if your features allow it.
-        max_horizon: int, optional (default=None)
-            Train this many models, where each model will predict a specific horizon.
-        refit : bool or int (default=True)
-            Retrain model for each cross validation window.
-            If False, the models are trained at the beginning and then used to predict each window.
-            If positive int, the models are retrained every `refit` windows.
-        before_predict_callback : callable, optional (default=None)
-            Function to call on the features before computing the predictions.
-                This function will take the input dataframe that will be passed to the model for predicting and should return a dataframe with the same structure.
-                The series identifier is on the index.
-        after_predict_callback : callable, optional (default=None)
-            Function to call on the predictions before updating the targets.
-                This function will take a pandas Series with the predictions and should return another one with the same structure.
-                The series identifier is on the index.
-        prediction_intervals : PredictionIntervals, optional (default=None)
-            Configuration to calibrate prediction intervals (Conformal Prediction).
-        level : list of ints or floats, optional (default=None)
-            Confidence levels between 0 and 100 for prediction intervals.
-        input_size : int, optional (default=None)
-            Maximum training samples per serie in each window. If None, will use an expanding window.
-        fitted : bool (default=False)
-            Store the in-sample predictions.
-        as_numpy : bool (default = False)
-            Cast features to numpy array.
+        id_col: str,
+        time_col: str,
+        target_col: str,
+        static_features: Optional[List[str]],
+        dropna: bool,
+        as_numpy: bool,
+    ) -> Tuple[Union[DataFrame, np.ndarray], np.ndarray, np.ndarray]:
+        """Compute the features and target for every row in `df` and which of them can be used for training."""
+        ts = self._new_ts()
+        prep = ts.fit_transform(
+            df,
+            id_col=id_col,
+            time_col=time_col,
+            target_col=target_col,
+            static_features=static_features,
+            dropna=False,
+            return_X_y=True,
+            as_numpy=as_numpy,
+        )
+        assert isinstance(prep, tuple)  # mypy
+        X, y = prep
+        keep = np.full(df.shape[0], True)
+        if dropna:
+            keep &= ~np.isnan(y)
+            for name in ts.transforms:
+                if name in df:
+                    continue
+                if isinstance(X, np.ndarray):
+                    vals = X[:, ts.features_order_.index(name)]
+                else:
+                    vals = X[name].to_numpy()
+                keep &= ~np.isnan(vals)
+        return X, y, keep
 
-        Returns
-        -------
-        result : pandas or polars DataFrame
-            Predictions for each window with the series id, timestamp, last train date, target value and predictions from each model.
-        """
-        results = []
-        self.cv_models_ = []
-        splits = ufp.backtest_splits(
+    def _fit_from_features(
+        self,
+        df: DataFrame,
+        X: Union[DataFrame, np.ndarray],
+        y: np.ndarray,
+        keep: np.ndarray,
+        id_col: str,
+        time_col: str,
+        target_col: str,
+        static_features: Optional[List[str]],
+        dropna: bool,
+        as_numpy: bool,
+    ) -> None:
+        """Save the series in `df` and train the models on features computed beforehand for the rows of `df` in `keep`."""
+        self.ts.dropna = dropna
+        self.ts.as_numpy = as_numpy
+        self.ts._fit(
             df,
-            n_windows=n_windows,
-            h=h,
             id_col=id_col,
             time_col=time_col,
-            freq=self.freq,
-            step_size=step_size,
-            input_size=input_size,
+            target_col=target_col,
+            static_features=static_features,
         )
-        self.cv_fitted_values_ = []
-        for i_window, (cutoffs, train, valid) in enumerate(splits):
-            should_fit = i_window == 0 or (refit > 0 and i_window % refit == 0)
-            if should_fit:
+        # what _transform does after computing the features
+        self.ts._set_dropped_series(keep)
+        del self.ts._restore_idxs, self.ts._sort_idxs
+        self.ts.max_horizon = None
+        self.fit_models(X, y)
+
+    def _cv_copy(self) -> "MLForecast":
+        """Copy with its own series and transformations."""
+        fcst = copy.copy(self)
+        fcst.ts = self._new_ts()
+        fcst.cv_models_ = []
+        fcst.cv_fitted_values_ = []
+        return fcst
+
+    def _cross_validation_windows(
+        self,
+        df: DataFrame,
+        windows: Iterable[Tuple[int, bool, DataFrame, DataFrame, DataFrame]],
+        features: Optional[Tuple[Union[DataFrame, np.ndarray], np.ndarray, np.ndarray]],
+        h: int,
+        id_col: str,
+        time_col: str,
+        target_col: str,
+        static_features: Optional[List[str]],
+        dropna: bool,
+        keep_last_n: Optional[int],
+        max_horizon: Optional[int],
+        before_predict_callback: Optional[Callable],
+        after_predict_callback: Optional[Callable],
+        prediction_intervals: Optional[PredictionIntervals],
+        level: Optional[List[Union[int, float]]],
+        fitted: bool,
+        as_numpy: bool,
+    ) -> List[DataFrame]:
+        """Fit (if required) and predict each window, returning the results."""
+        results = []
+        # series of the last window trained from the features, their lag transforms states are continued in the next one
+        prev_ts: Optional[TimeSeries] = None
+        for i_window, should_fit, cutoffs, train, valid in windows:
+            if should_fit and features is not None:
+                all_X, all_y, all_keep = features
+                row_cutoffs = ufp.join(df[[id_col]], cutoffs, on=id_col, how="left")[
+                    "cutoff"
+                ]
+                in_train = df[time_col].to_numpy() <= row_cutoffs.to_numpy()
+                keep = all_keep & in_train
+                if isinstance(all_X, np.ndarray):
+                    X = all_X[keep]
+                else:
+                    X = ufp.filter_with_mask(all_X, keep)
+                self._cs_scores = None
+                self._fit_from_features(
+                    train,
+                    X=X,
+                    y=all_y[keep],
+                    keep=keep[in_train],
+                    id_col=id_col,
+                    time_col=time_col,
+                    target_col=target_col,
+                    static_features=static_features,
+                    dropna=dropna,
+                    as_numpy=as_numpy,
+                )
+                if prev_ts is not None:
+                    self.ts._continue_lag_tfms_states(prev_ts)
+                self.cv_models_.append(self.models_)
+            elif should_fit:
                 self.fit(
                     train,
                     id_col=id_col,
@@ -910,6 +1386,9 @@ class MLForecast:
                 level=level,
                 X_df=X_df,
             )
+            if should_fit and features is not None:
+                # the states are computed when predicting and the series are replaced when fitting
+                prev_ts = copy.copy(self.ts)
             y_pred = ufp.join(y_pred, cutoffs, on=id_col, how="left")
             result = ufp.join(
                 valid[[id_col, time_col, target_col]],
@@ -926,7 +1405,192 @@ class MLForecast:
                     "and that there aren't any missing periods."
                 )
             results.append(result)
-        del self.models_
+        return results
+
+    def cross_validation(
+        self,
+        df: DataFrame,
+        n_windows: int,
+        h: int,
+        id_col: str = "unique_id",
+        time_col: str = "ds",
+        target_col: str = "y",
+        step_size: Optional[int] = None,
+        static_features: Optional[List[str]] = None,
+        dropna: bool = True,
+        keep_last_n: Optional[int] = None,
+        refit: Union[bool, int] = True,
+        max_horizon: Optional[int] = None,
+        before_predict_callback: Optional[Callable] = None,
+        after_predict_callback: Optional[Callable] = None,
+        prediction_intervals: Optional[PredictionIntervals] = None,
+        level: Optional[List[Union[int, float]]] = None,
+        input_size: Optional[int] = None,
+        fitted: bool = False,
+        as_numpy: bool = False,
+        n_jobs: int = 1,
+    ) -> DataFrame:
+        """Perform time series cross validation.
+        Creates `n_windows` splits where each window has `h` test periods,
+        trains the models, computes the predictions and merges the actuals.
+
+        Parameters
+        ----------
+        df : pandas or polars DataFrame, polars LazyFrame, pyarrow Dataset or path to parquet files
+            Series data in long format. The last three are read with polars sorted by id and time.
+        n_windows : int
+            Number of windows to evaluate.
+        h : int
+            Forecast horizon.
+        id_col : str (default='unique_id')
+            Column that identifies each serie.
+        time_col : str (default='ds')
+            Column that identifies each timestep, its values can be timestamps or integers.
+        target_col : str (default='y')
+            Column that contains the target.
+        step_size : int, optional (default=None)
+            Step size between each cross validation window. If None it will be equal to `h`.
+        static_features : list of str, optional (default=None)
+            Names of the features that are static and will be repeated when forecasting.
+        dropna : bool (default=True)
+            Drop rows with missing values produced by the transformations.
+        keep_last_n : int, optional (default=None)
+            Keep only these many records from each serie for the forecasting step. Can save time and memory if your features allow it.
+        max_horizon: int, optional (default=None)
+            Train this many models, where each model will predict a specific horizon.
+        refit : bool or int (default=True)
+            Retrain model for each cross validation window.
+            If False, the models are trained at the beginning and then used to predict each window.
+            If positive int, the models are retrained every `refit` windows.
+        before_predict_callback : callable, optional (default=None)
+            Function to call on the features before computing the predictions.
+                This function will take the input dataframe that will be passed to the model for predicting and should return a dataframe with the same structure.
+                The series identifier is on the index.
+        after_predict_callback : callable, optional (default=None)
+            Function to call on the predictions before updating the targets.
+                This function will take a pandas Series with the predictions and should return another one with the same structure.
+                The series identifier is on the index.
+        prediction_intervals : PredictionIntervals, optional (default=None)
+            Configuration to calibrate prediction intervals (Conformal Prediction).
+        level : list of ints or floats, optional (default=None)
+            Confidence levels between 0 and 100 for prediction intervals.
+        input_size : int, optional (default=None)
+            Maximum training samples per serie in each window. If None, will use an expanding window.
+        fitted : bool (default=False)
+            Store the in-sample predictions.
+        as_numpy : bool (default = False)
+            Cast features to numpy array.
+        n_jobs : int (default=1)
+            Number of threads used to evaluate the windows in parallel.
+            Each window that retrains the models is evaluated along with the following ones that don't by a copy of this object.
+
+        Returns
+        -------
+        result : pandas or polars DataFrame
+            Predictions for each window with the series id, timestamp, last train date, target value and predictions from each model.
+        """
+        if n_jobs < 1:
+            raise ValueError(f"n_jobs must be a positive integer, got {n_jobs}.")
+        df = _collect_sorted(df, id_col, time_col)
+        self.cv_models_: List[Dict[str, Union[BaseEstimator, List[BaseEstimator]]]] = []
+        splits = ufp.backtest_splits(
+            df,
+            n_windows=n_windows,
+            h=h,
+            id_col=id_col,
+            time_col=time_col,
+            freq=self.freq,
+            step_size=step_size,
+            input_size=input_size,
+        )
+        self.cv_fitted_values_: List[DataFrame] = []
+        # the features of each row only depend on the previous values of its serie, so if
+        # the windows start at the same time and nothing else depends on the training data
+        # we compute them once and take the rows before each cutoff to train the models
+        reuse_features = (
+            input_size is None
+            and keep_last_n is None
+            and max_horizon is None
+            and prediction_intervals is None
+            and not fitted
+            and all(
+                isinstance(tfm, Differences) for tfm in self.ts.target_transforms or []
+            )
+        )
+        if reuse_features:
+            features = self._cv_features(
+                df,
+                id_col=id_col,
+                time_col=time_col,
+                target_col=target_col,
+                static_features=static_features,
+                dropna=dropna,
+                as_numpy=as_numpy,
+            )
+        else:
+            features = None
+        windows = (
+            (
+                i_window,
+                i_window == 0 or (refit > 0 and i_window % refit == 0),
+                cutoffs,
+                train,
+                valid,
+            )
+            for i_window, (cutoffs, train, valid) in enumerate(splits)
+        )
+        # evaluates a list of windows with this object or a copy of it
+        evaluate_windows = partial(
+            MLForecast._cross_validation_windows,
+            df=df,
+            features=features,
+            h=h,
+            id_col=id_col,
+            time_col=time_col,
+            target_col=target_col,
+            static_features=static_features,
+            dropna=dropna,
+            keep_last_n=keep_last_n,
+            max_horizon=max_horizon,
+            before_predict_callback=before_predict_callback,
+            after_predict_callback=after_predict_callback,
+            prediction_intervals=prediction_intervals,
+            level=level,
+            fitted=fitted,
+            as_numpy=as_numpy,
+        )
+        if n_jobs == 1:
+            results = evaluate_windows(self, windows=windows)
+        else:
+            # the windows that aren't refitted use the models from the previous ones,
+            # so each group starting at a refit is evaluated by an independent copy
+            results = []
+            futures = []
+            n_done = 0
+            with concurrent.futures.ThreadPoolExecutor(n_jobs) as executor:
+                for group in _group_cv_windows(windows):
+                    fcst = self._cv_copy()
+                    future = executor.submit(evaluate_windows, fcst, windows=group)
+                    futures.append((fcst, future))
+                    # limit the number of training sets in memory
+                    if len(futures) - n_done >= n_jobs:
+                        futures[n_done][1].result()
+                        n_done += 1
+                for fcst, future in futures:
+                    results.extend(future.result())
+                    self.cv_models_.extend(fcst.cv_models_)
+                    self.cv_fitted_values_.extend(fcst.cv_fitted_values_)
+            # keep the state of the last window, as when they're evaluated sequentially
+            for attr in (
+                "ts",
+                "prediction_intervals",
+                "_cs_scores",
+                "fcst_fitted_values_",
+            ):
+                if hasattr(fcst, attr):
+                    setattr(self, attr, getattr(fcst, attr))
+        if hasattr(self, "models_"):
+            del self.models_
         out = ufp.vertical_concat(results, match_categories=False)
         out = ufp.drop_index_if_pandas(out)
         first_out_cols = [id_col, time_col, "cutoff", target_col]
@@ -942,29 +1606,147 @@ class MLForecast:
         out = ufp.drop_index_if_pandas(out)
         return out[first_out_cols + remaining_cols]
 
-    def save(self, path: Union[str, Path]) -> None:
+    def save(self, path: Union[str, Path], binary: bool = False) -> None:
         """Save forecast object
 
         Parameters
         ----------
         path : str or pathlib.Path
-            Directory where artifacts will be stored."""
-        self.ts.save(f"{path}/ts.pkl")
+            Directory where artifacts will be stored.
+        binary : bool (default=False)
+            Store the series values as npy files, which can be memory-mapped when loading.
+        """
+        if binary:
+            self.ts.save(f"{path}/ts", binary=True)
+        else:
+            self.ts.save(f"{path}/ts.pkl")
         with fsspec.open(f"{path}/models.pkl", "wb") as f:
             cloudpickle.dump(self.models_, f)
+        if getattr(self, "_cs_scores", None) is not None:
+            intervals = {
+                "scores": self._cs_scores,
+                "settings": self.prediction_intervals,
+                "uids": self.ts.uids,
+            }
+            with fsspec.open(f"{path}/intervals.pkl", "wb") as f:
+                cloudpickle.dump(intervals, f)
 
     @staticmethod
-    def load(path: Union[str, Path]) -> "MLForecast":
+    def load(
+        path: Union[str, Path],
+        mmap: bool = False,
+        ids: Optional[List[str]] = None,
+    ) -> "MLForecast":
         """Load forecast object
 
         Parameters
         ----------
         path : str or pathlib.Path
-            Directory with saved artifacts."""
-        ts = TimeSeries.load(f"{path}/ts.pkl")
+            Directory with saved artifacts.
+        mmap : bool (default=False)
+            Memory-map the series values (read-only) instead of reading them into memory.
+            Only works for objects saved with `binary=True` in the local filesystem.
+        ids : list of str, optional (default=None)
+            Load only the data of these series, which are the only ones that can be forecasted.
+            Only works for objects saved with `binary=True`."""
+        fs, root = fsspec.core.url_to_fs(str(path))
+        if fs.exists(f"{root}/ts"):
+            ts = TimeSeries.load(f"{path}/ts", mmap=mmap, ids=ids)
+        else:
+            ts = TimeSeries.load(f"{path}/ts.pkl", ids=ids)
         with fsspec.open(f"{path}/models.pkl", "rb") as f:
             models = cloudpickle.load(f)
         fcst = MLForecast(models=models, freq=ts.freq)
         fcst.ts = ts
         fcst.models_ = models
+        fcst._cs_scores = None
+        if fs.exists(f"{root}/intervals.pkl"):
+            with fsspec.open(f"{path}/intervals.pkl", "rb") as f:
+                intervals = cloudpickle.load(f)
+            scores = intervals["scores"]
+            if ids is not None:
+                # the loaded series are a subset of the saved ones, in the same order
+                uids = pd.Index(np.asarray(intervals["uids"]))
+                scores = scores[:, uids.get_indexer(np.asarray(ts.uids))]
+            fcst._cs_scores = scores
+            fcst.prediction_intervals = intervals["settings"]
         return fcst
+
+# %% ../nbs/forecast.ipynb 17
+class Predictor:
+    """Computes the predictions of a fitted `MLForecast` object for many calls,
+    preparing once everything that doesn't change between them.
+
+    Changes made to the forecast object after creating the predictor (e.g. fitting it again or updating its series) aren't seen by it.
+    `Predictor.predict` can be called from several threads at the same time."""
+
+    def __init__(self, fcst: MLForecast):
+        """
+        Parameters
+        ----------
+        fcst : MLForecast
+            Fitted forecast object.
+        """
+        if not hasattr(fcst, "models_"):
+            raise ValueError(
+                "No fitted models found. You have to call fit or preprocess + fit_models."
+            )
+        ts = copy.copy(fcst.ts)
+        # own copies of the states that are modified when updating the forecast object
+        ts.transforms = copy.deepcopy(ts.transforms)
+        ts.target_transforms = copy.deepcopy(ts.target_transforms)
+        ts._compute_missing_lag_tfms_states()
+        # these are shared by the copies made on each call
+        ts._get_uids_index()
+        ts._predict_static_columns()
+        if not hasattr(ts, "_date_features_cache"):
+            ts._date_features_cache = {}
+        self._fcst = copy.copy(fcst)
+        self._fcst.ts = ts
+
+    def predict(
+        self,
+        h: int,
+        ids: Optional[List[str]] = None,
+        X_df: Optional[DataFrame] = None,
+        level: Optional[List[Union[int, float]]] = None,
+        before_predict_callback: Optional[Callable] = None,
+        after_predict_callback: Optional[Callable] = None,
+    ) -> DataFrame:
+        """Compute the predictions for the next `h` steps.
+
+        Parameters
+        ----------
+        h : int
+            Number of periods to predict.
+        ids : list of str, optional (default=None)
+            List with subset of ids seen during training for which the forecasts should be computed.
+        X_df : pandas or polars DataFrame, optional (default=None)
+            Dataframe with the future exogenous features. Should have the id column and the time column.
+        level : list of ints or floats, optional (default=None)
+            Confidence levels between 0 and 100 for prediction intervals.
+        before_predict_callback : callable, optional (default=None)
+            Function to call on the features before computing the predictions.
+        after_predict_callback : callable, optional (default=None)
+            Function to call on the predictions before updating the targets.
+
+        Returns
+        -------
+        result : pandas or polars DataFrame
+            Predictions for each serie and timestep, with one column per model.
+        """
+        # the state of each call is stored in its own copies
+        fcst = copy.copy(self._fcst)
+        fcst.ts = copy.copy(self._fcst.ts)
+        if fcst.ts.target_transforms is not None:
+            fcst.ts.target_transforms = [
+                copy.copy(tfm) for tfm in fcst.ts.target_transforms
+            ]
+        return fcst.predict(
+            h,
+            before_predict_callback=before_predict_callback,
+            after_predict_callback=after_predict_callback,
+            level=level,
+            X_df=X_df,
+            ids=ids,
+        )
@@ -1,11 +1,11 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/grouped_array.ipynb.
 
 # %% auto 0
-__all__ = ['GroupedArray']
+__all__ = ['GroupedArray', 'ExpandedTarget']
 
 # %% ../nbs/grouped_array.ipynb 1
 import concurrent.futures
-from typing import Any, Dict, Tuple, Union
+from typing import Any, Dict, Optional, Tuple, Union
 
 import numpy as np
 from numba import njit
@@ -15,22 +15,26 @@ from .compat import BaseLagTransform, CoreGroupedArray
 
 # %% ../nbs/grouped_array.ipynb 2
 @njit(nogil=True)
-def _transform_series(data, indptr, updates_only, lag, func, *args) -> np.ndarray:
+def _transform_series(
+    data, indptr, starts, updates_only, lag, func, *args
+) -> np.ndarray:
     """Shifts every group in `data` by `lag` and computes `func(shifted, *args)`.
 
+    The values of each group are the ones between `starts[i]` and `indptr[i + 1]`.
     If `updates_only=True` only last value of the transformation for each group is returned,
     otherwise the full transformation is returned"""
     n_series = len(indptr) - 1
     if updates_only:
         out = np.empty_like(data[:n_series])
         for i in range(n_series):
-            lagged = shift_array(data[indptr[i] : indptr[i + 1]], lag)
+            lagged = shift_array(data[starts[i] : indptr[i + 1]], lag)
             out[i] = func(lagged, *args)[-1]
     else:
         out = np.empty_like(data)
         for i in range(n_series):
-            lagged = shift_array(data[indptr[i] : indptr[i + 1]], lag)
-            out[indptr[i] : indptr[i + 1]] = func(lagged, *args)
+            out[indptr[i] : starts[i]] = np.nan
+            lagged = shift_array(data[starts[i] : indptr[i + 1]], lag)
+            out[starts[i] : indptr[i + 1]] = func(lagged, *args)
     return out
 
 
@@ -113,6 +117,48 @@ def _expand_target(data, indptr, max_horizon):
     return out
 
 
+@njit
+def _target_horizon(data, rows, ends, horizon):
+    """Value `horizon` steps after each row, or nan if its group ends before that."""
+    out = np.empty(rows.size, dtype=data.dtype)
+    for i in range(rows.size):
+        idx = rows[i] + horizon
+        if idx < ends[i]:
+            out[i] = data[idx]
+        else:
+            out[i] = np.nan
+    return out
+
+
+@njit
+def _target_all_nan(data, rows, ends, max_horizon):
+    """Whether all the values in the next `max_horizon` steps of each row are nan."""
+    out = np.full(rows.size, True)
+    for i in range(rows.size):
+        for idx in range(rows[i], min(rows[i] + max_horizon, ends[i])):
+            if not np.isnan(data[idx]):
+                out[i] = False
+                break
+    return out
+
+
+@njit
+def _take(
+    data: np.ndarray, indptr: np.ndarray, idxs: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Select the groups in `idxs`, which may contain repeated values."""
+    new_indptr = np.empty(idxs.size + 1, dtype=indptr.dtype)
+    new_indptr[0] = 0
+    for i, idx in enumerate(idxs):
+        new_indptr[i + 1] = new_indptr[i] + indptr[idx + 1] - indptr[idx]
+    new_data = np.empty(new_indptr[-1], dtype=data.dtype)
+    for i, idx in enumerate(idxs):
+        new_data[new_indptr[i] : new_indptr[i + 1]] = data[
+            indptr[idx] : indptr[idx + 1]
+        ]
+    return new_data, new_indptr
+
+
 @njit
 def _append_one(
     data: np.ndarray, indptr: np.ndarray, new: np.ndarray
@@ -130,6 +176,36 @@ def _append_one(
     return new_data, new_indptr
 
 
+@njit
+def _reserve(
+    data: np.ndarray, indptr: np.ndarray, idxs: np.ndarray, n: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Copy the groups in `idxs` leaving space for `n` values after each one, filled with NaNs."""
+    n_series = idxs.size
+    new_indptr = np.empty(n_series + 1, dtype=indptr.dtype)
+    new_indptr[0] = 0
+    starts = np.empty(n_series, dtype=indptr.dtype)
+    size = 0
+    for idx in idxs:
+        size += indptr[idx + 1] - indptr[idx] + n
+    new_data = np.full(size, np.nan, dtype=data.dtype)
+    start = 0
+    for i, idx in enumerate(idxs):
+        starts[i] = start
+        new_indptr[i + 1] = start + indptr[idx + 1] - indptr[idx]
+        new_data[starts[i] : new_indptr[i + 1]] = data[indptr[idx] : indptr[idx + 1]]
+        start = new_indptr[i + 1] + n
+    return new_data, new_indptr, starts
+
+
+@njit
+def _append_one_inplace(data: np.ndarray, indptr: np.ndarray, new: np.ndarray) -> None:
+    """Write each value of new after the end of each group and move the ends."""
+    for i in range(len(indptr) - 1):
+        data[indptr[i + 1]] = new[i]
+        indptr[i + 1] += 1
+
+
 @njit
 def _append_several(
     data: np.ndarray,
@@ -167,6 +243,11 @@ class GroupedArray:
     All the data is stored in a single 1d array `data`.
     The indices for the group boundaries are stored in another 1d array `indptr`."""
 
+    # start of the values of each group and number of values that can still be appended in place.
+    # only set by `reserve`, where the free space of each group precedes the next one.
+    _starts: Optional[np.ndarray] = None
+    _capacity: int = 0
+
     def __init__(self, data: np.ndarray, indptr: np.ndarray):
         self.data = data
         self.indptr = indptr
@@ -176,7 +257,7 @@ class GroupedArray:
         return self.n_groups
 
     def __getitem__(self, idx: int) -> np.ndarray:
-        return self.data[self.indptr[idx] : self.indptr[idx + 1]]
+        return self.data[self._group_starts()[idx] : self.indptr[idx + 1]]
 
     def __setitem__(self, idx: int, vals: np.ndarray):
         if self[idx].size != vals.size:
@@ -186,14 +267,14 @@ class GroupedArray:
     def __copy__(self):
         return GroupedArray(self.data.copy(), self.indptr)
 
+    def _group_starts(self) -> np.ndarray:
+        if self._starts is None:
+            return self.indptr[:-1]
+        return self._starts
+
     def take(self, idxs: np.ndarray) -> "GroupedArray":
-        idxs = np.asarray(idxs)
-        ranges = [range(self.indptr[i], self.indptr[i + 1]) for i in idxs]
-        items = [self.data[rng] for rng in ranges]
-        sizes = np.array([item.size for item in items])
-        data = np.hstack(items)
-        indptr = np.append(0, sizes.cumsum())
-        return GroupedArray(data, indptr)
+        new_data, new_indptr = _take(self.data, self.indptr, np.asarray(idxs))
+        return GroupedArray(new_data, new_indptr)
 
     def apply_transforms(
         self,
@@ -217,10 +298,23 @@ class GroupedArray:
             else:
                 lag, tfm, *args = tfm
                 results[tfm_name] = _transform_series(
-                    self.data, self.indptr, updates_only, lag - offset, tfm, *args
+                    self.data,
+                    self.indptr,
+                    self._group_starts(),
+                    updates_only,
+                    lag - offset,
+                    tfm,
+                    *args,
                 )
         return results
 
+    def _shards(self, n_shards: int) -> np.ndarray:
+        """Boundaries of at most `n_shards` contiguous ranges of groups with a similar number of values."""
+        targets = np.linspace(0, self.indptr[-1], n_shards + 1)
+        bounds = np.searchsorted(self.indptr, targets)
+        bounds[-1] = self.n_groups
+        return np.unique(bounds)
+
     def apply_multithreaded_transforms(
         self,
         transforms: Dict[str, Union[Tuple[Any, ...], BaseLagTransform]],
@@ -229,6 +323,8 @@ class GroupedArray:
     ) -> Dict[str, np.ndarray]:
         """Apply the transformations using multithreading.
 
+        The groups are split in `num_threads` shards and each transformation is computed
+        for every shard in parallel, so all the threads are used even with few transformations.
         If `updates_only` then only the updates are returned.
         """
         future_to_result = {}
@@ -241,22 +337,33 @@ class GroupedArray:
                 core_tfms[name] = tfm
             else:
                 numba_tfms[name] = tfm
+        starts = self._group_starts()
+        shards = self._shards(num_threads)
         with concurrent.futures.ThreadPoolExecutor(num_threads) as executor:
             for tfm_name, (lag, tfm, *args) in numba_tfms.items():
-                future = executor.submit(
-                    _transform_series,
-                    self.data,
-                    self.indptr,
-                    updates_only,
-                    lag - offset,
-                    tfm,
-                    *args,
-                )
-                future_to_result[future] = tfm_name
+                if updates_only:
+                    results[tfm_name] = np.empty_like(self.data[: self.n_groups])
+                else:
+                    results[tfm_name] = np.empty_like(self.data)
+                for lo, hi in zip(shards[:-1], shards[1:]):
+                    first, last = self.indptr[lo], self.indptr[hi]
+                    future = executor.submit(
+                        _transform_series,
+                        self.data[first:last],
+                        self.indptr[lo : hi + 1] - first,
+                        starts[lo:hi] - first,
+                        updates_only,
+                        lag - offset,
+                        tfm,
+                        *args,
+                    )
+                    out_idxs = slice(lo, hi) if updates_only else slice(first, last)
+                    future_to_result[future] = tfm_name, out_idxs
             for future in concurrent.futures.as_completed(future_to_result):
-                tfm_name = future_to_result[future]
-                results[tfm_name] = future.result()
+                tfm_name, out_idxs = future_to_result[future]
+                results[tfm_name][out_idxs] = future.result()
         if core_tfms:
+            # the core transformations split the groups between the threads themselves
             core_ga = CoreGroupedArray(self.data, self.indptr, num_threads)
             for name, tfm in core_tfms.items():
                 if updates_only:
@@ -298,10 +405,29 @@ class GroupedArray:
         indptr = np.append(0, sizes.cumsum())
         return GroupedArray(data, indptr)
 
+    def reserve(self, n: int, idxs: Optional[np.ndarray] = None) -> "GroupedArray":
+        """Returns a copy of the groups in `idxs` (all by default) with space for `n` more values in each one, which are appended in place."""
+        if idxs is None:
+            idxs = np.arange(self.n_groups)
+        new_data, new_indptr, starts = _reserve(
+            self.data, self.indptr, np.asarray(idxs), n
+        )
+        ga = GroupedArray(new_data, new_indptr)
+        ga._starts = starts
+        ga._capacity = n
+        return ga
+
     def append(self, new: np.ndarray) -> "GroupedArray":
-        """Appends each element of `new` to each existing group. Returns a copy."""
+        """Appends each element of `new` to each existing group.
+
+        Returns a copy, unless there's reserved space left, in which case the values are written in place.
+        """
         if new.size != self.n_groups:
             raise ValueError(f"new must be of size {self.n_groups}")
+        if self._capacity > 0:
+            _append_one_inplace(self.data, self.indptr, new)
+            self._capacity -= 1
+            return self
         new_data, new_indptr = _append_one(self.data, self.indptr, new)
         return GroupedArray(new_data, new_indptr)
 
@@ -315,3 +441,76 @@ class GroupedArray:
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(ndata={self.data.size}, n_groups={self.n_groups})"
+
+# %% ../nbs/grouped_array.ipynb 5
+class ExpandedTarget:
+    """Target for the next `max_horizon` steps of each row, computed one horizon at a time.
+
+    Behaves like the `(n_rows, max_horizon)` array returned by `GroupedArray.expand_target`,
+    but only stores the position of each row in `data` and the end of its group."""
+
+    def __init__(
+        self, data: np.ndarray, rows: np.ndarray, ends: np.ndarray, max_horizon: int
+    ):
+        self.data = data
+        self.rows = rows
+        self.ends = ends
+        self.max_horizon = max_horizon
+
+    @classmethod
+    def from_grouped_array(cls, ga: GroupedArray, max_horizon: int) -> "ExpandedTarget":
+        rows = np.arange(ga.data.size, dtype=ga.indptr.dtype)
+        ends = np.repeat(ga.indptr[1:], np.diff(ga.indptr))
+        return cls(ga.data, rows, ends, max_horizon)
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.rows.size, self.max_horizon
+
+    @property
+    def ndim(self) -> int:
+        return 2
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self.data.dtype
+
+    def __len__(self) -> int:
+        return self.rows.size
+
+    def __getitem__(self, key):
+        """Select rows (returns a new `ExpandedTarget`) or values (returns an array), expanding only the selected rows."""
+        if isinstance(key, tuple) and len(key) == 2:
+            row_key, horizon_key = key
+        else:
+            row_key, horizon_key = key, None
+        rows = self.rows[row_key]
+        ends = self.ends[row_key]
+        if rows.ndim == 1:
+            if horizon_key is None:
+                return ExpandedTarget(self.data, rows, ends, self.max_horizon)
+            if isinstance(horizon_key, (int, np.integer)):
+                horizon = range(self.max_horizon)[horizon_key]
+                return _target_horizon(self.data, rows, ends, horizon)
+        selected = ExpandedTarget(
+            self.data, rows.ravel(), ends.ravel(), self.max_horizon
+        )
+        out = np.asarray(selected).reshape(rows.shape + (self.max_horizon,))
+        if horizon_key is None:
+            return out
+        return out[..., horizon_key]
+
+    def all_nan(self) -> np.ndarray:
+        """Whether each row has no target values in any horizon."""
+        return _target_all_nan(self.data, self.rows, self.ends, self.max_horizon)
+
+    def __array__(self, dtype=None) -> np.ndarray:
+        out = np.empty(self.shape, dtype=self.dtype)
+        for horizon in range(self.max_horizon):
+            out[:, horizon] = self[:, horizon]
+        if dtype is not None:
+            out = out.astype(dtype, copy=False)
+        return out
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(n_rows={self.rows.size}, max_horizon={self.max_horizon})"
@@ -6,9 +6,11 @@ __all__ = ['RollingMean', 'RollingStd', 'RollingMin', 'RollingMax', 'RollingQuan
            'ExpandingStd', 'ExpandingMin', 'ExpandingMax', 'ExpandingQuantile', 'ExponentiallyWeightedMean']
 
 # %% ../nbs/lag_transforms.ipynb 3
-from typing import Optional
+import copy
+from typing import List, Optional
 
 import numpy as np
+from window_ops import ewm, expanding, rolling
 
 try:
     import coreforecast.lag_transforms as core_tfms
@@ -24,6 +26,9 @@ from sklearn.base import BaseEstimator
 # %% ../nbs/lag_transforms.ipynb 4
 class BaseLagTransform(BaseEstimator):
     _core_tfm: core_tfms.BaseLagTransform
+    # whether the updates depend on a state computed by `transform`,
+    # the ones that don't compute their updates from the last values of each group
+    _stateful: bool = True
 
     def transform(self, ga: CoreGroupedArray) -> np.ndarray:
         return self._core_tfm.transform(ga)
@@ -31,8 +36,39 @@ class BaseLagTransform(BaseEstimator):
     def update(self, ga: CoreGroupedArray) -> np.ndarray:
         return self._core_tfm.update(ga)
 
+    def take(self, idxs: Optional[np.ndarray]) -> "BaseLagTransform":
+        """Copy of the transformation holding the state of the groups in `idxs`.
+
+        If `idxs` is None the state of all groups is copied."""
+        tfm = copy.copy(self)
+        tfm._core_tfm = copy.copy(self._core_tfm)
+        for name, value in vars(self._core_tfm).items():
+            if isinstance(value, np.ndarray):
+                value = value.copy() if idxs is None else value[idxs]
+                setattr(tfm._core_tfm, name, value)
+        return tfm
+
+    def put(self, idxs: np.ndarray, tfm: "BaseLagTransform") -> None:
+        """Store the state of `tfm` as the state of the groups in `idxs`."""
+        for name, value in vars(tfm._core_tfm).items():
+            if isinstance(value, np.ndarray):
+                getattr(self._core_tfm, name)[idxs] = value
+
+    @staticmethod
+    def stack(transforms: List["BaseLagTransform"]) -> "BaseLagTransform":
+        """Copy of the first transformation holding the states of all of them, one group after the other."""
+        tfm = copy.copy(transforms[0])
+        tfm._core_tfm = copy.copy(transforms[0]._core_tfm)
+        for name, value in vars(tfm._core_tfm).items():
+            if isinstance(value, np.ndarray):
+                states = [getattr(t._core_tfm, name) for t in transforms]
+                setattr(tfm._core_tfm, name, np.concatenate(states))
+        return tfm
+
 # %% ../nbs/lag_transforms.ipynb 5
 class Lag(BaseLagTransform):
+    _stateful = False
+
     def __init__(self, lag: int):
         self.lag = lag
         self._core_tfm = core_tfms.Lag(lag=lag)
@@ -43,6 +79,7 @@ class Lag(BaseLagTransform):
 # %% ../nbs/lag_transforms.ipynb 6
 class RollingBase(BaseLagTransform):
     "Rolling statistic"
+    _stateful = False
 
     def __init__(self, window_size: int, min_samples: Optional[int] = None):
         """
@@ -98,6 +135,8 @@ class RollingQuantile(RollingBase):
 class SeasonalRollingBase(BaseLagTransform):
     """Rolling statistic over seasonal periods"""
 
+    _stateful = False
+
     def __init__(
         self, season_length: int, window_size: int, min_samples: Optional[int] = None
     ):
@@ -196,6 +235,8 @@ class ExpandingMax(ExpandingBase):
 
 
 class ExpandingQuantile(ExpandingBase):
+    _stateful = False
+
     def __init__(self, p: float):
         self.p = p
 
@@ -219,3 +260,22 @@ class ExponentiallyWeightedMean(BaseLagTransform):
     def _set_core_tfm(self, lag: int):
         self._core_tfm = core_tfms.ExponentiallyWeightedMean(lag=lag, alpha=self.alpha)
         return self
+
+# %% ../nbs/lag_transforms.ipynb 17
+# the window_ops functions recompute the statistic from the whole serie to get each update,
+# these compute the same but keep the state of each serie, so their updates don't depend on its length
+_window_ops_equivalents = {
+    rolling.rolling_mean: RollingMean,
+    rolling.rolling_std: RollingStd,
+    rolling.rolling_min: RollingMin,
+    rolling.rolling_max: RollingMax,
+    rolling.seasonal_rolling_mean: SeasonalRollingMean,
+    rolling.seasonal_rolling_std: SeasonalRollingStd,
+    rolling.seasonal_rolling_min: SeasonalRollingMin,
+    rolling.seasonal_rolling_max: SeasonalRollingMax,
+    expanding.expanding_mean: ExpandingMean,
+    expanding.expanding_std: ExpandingStd,
+    expanding.expanding_min: ExpandingMin,
+    expanding.expanding_max: ExpandingMax,
+    ewm.ewm_mean: ExponentiallyWeightedMean,
+}
@@ -264,12 +264,13 @@ class LightGBMCV:
         with ThreadPoolExecutor(self.num_threads) as executor:
             futures = []
             for ts, bst, valid in self.items:
-                _update(bst, num_iterations)
+                # the boosters release the GIL while training, so every window trains and predicts in its own thread
                 future = executor.submit(
-                    _predict,
+                    _update_and_predict,
                     ts=ts,
                     bst=bst,
                     valid=valid,
+                    n=num_iterations,
                     h=self.h,
                     before_predict_callback=before_predict_callback,
                     after_predict_callback=after_predict_callback,
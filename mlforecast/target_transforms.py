@@ -68,6 +68,12 @@ class BaseGroupedArrayTargetTransform(abc.ABC):
     def inverse_transform_fitted(self, ga: GroupedArray) -> GroupedArray:
         return self.inverse_transform(ga)
 
+    def take(self, idxs: np.ndarray) -> "BaseGroupedArrayTargetTransform":
+        """Copy of the transformation holding the state of the series in `idxs`."""
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support taking a subset of the series."
+        )
+
 # %% ../nbs/target_transforms.ipynb 7
 class Differences(BaseGroupedArrayTargetTransform):
     """Subtracts previous values of the serie. Can be used to remove trend or seasonalities."""
@@ -122,6 +128,11 @@ class Differences(BaseGroupedArrayTargetTransform):
             fitted.restore_fitted_difference(ga.data, ga.indptr, d)
         return ga
 
+    def take(self, idxs: np.ndarray) -> "Differences":
+        tfm = copy.copy(self)
+        tfm.original_values_ = [ga.take(idxs) for ga in self.original_values_]
+        return tfm
+
 # %% ../nbs/target_transforms.ipynb 10
 class BaseLocalScaler(BaseGroupedArrayTargetTransform):
     scaler_factory: type
@@ -163,6 +174,12 @@ class BaseLocalScaler(BaseGroupedArrayTargetTransform):
     def inverse_transform_fitted(self, ga: GroupedArray) -> GroupedArray:
         return self.inverse_transform(ga)
 
+    def take(self, idxs: np.ndarray) -> "BaseLocalScaler":
+        tfm = copy.copy(self)
+        tfm.scaler_ = copy.copy(self.scaler_)
+        tfm.scaler_.stats_ = self.scaler_.stats_[idxs]
+        return tfm
+
 # %% ../nbs/target_transforms.ipynb 12
 class LocalStandardScaler(BaseLocalScaler):
     """Standardizes each serie by subtracting its mean and dividing by its standard deviation."""
@@ -210,6 +227,12 @@ class LocalBoxCox(BaseLocalScaler):
         lmbdas = np.repeat(lmbdas, sizes, axis=0)
         return GroupedArray(inv_boxcox1p(ga.data, lmbdas), ga.indptr)
 
+    def take(self, idxs: np.ndarray) -> "LocalBoxCox":
+        tfm = copy.copy(self)
+        tfm.scaler_ = copy.copy(self.scaler_)
+        tfm.scaler_.lmbdas_ = self.scaler_.lmbdas_[idxs]
+        return tfm
+
 # %% ../nbs/target_transforms.ipynb 21
 class GlobalSklearnTransformer(BaseTargetTransform):
     """Applies the same scikit-learn transformer to all series."""
@@ -100,3 +100,28 @@ def test_predict(benchmark, fcst: MLForecast, series, use_exog, series_with_exog
     evaluation = smape(full_preds, models=models)
     summary = evaluation[models].mean(axis=0)
     assert summary["lr"] < summary["seas_naive"]
+
+
+@pytest.fixture(scope="module", params=[False, True], ids=["df", "numpy"])
+def fitted_lr(request, series):
+    fcst = MLForecast(
+        models={"lr": LinearRegression()},
+        freq="D",
+        lags=[1, 7, 14],
+        lag_transforms={
+            1: [RollingMean(7)],
+            7: [RollingMean(7), RollingMin(7), RollingMax(7)],
+        },
+        date_features=["dayofweek", "month"],
+        target_transforms=[Differences([1]), LocalStandardScaler()],
+    )
+    statics = series.columns.drop(["unique_id", "ds", "y"]).tolist()
+    return fcst.fit(series, static_features=statics, as_numpy=request.param)
+
+
+@pytest.mark.parametrize("n_ids", [1, 10, 100])
+def test_predict_subset_latency(benchmark, fitted_lr: MLForecast, n_ids):
+    uids = fitted_lr.ts.uids
+    ids = uids[:: len(uids) // n_ids][:n_ids].tolist()
+    preds = benchmark(fitted_lr.predict, 14, ids=ids)
+    assert preds["unique_id"].nunique() == n_ids